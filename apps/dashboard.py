@@ -163,7 +163,7 @@ def get_recent_trades(limit=20):
     trades_file = DATA_DIR / "trades.jsonl"
     
     if trades_file.exists():
-        with open(trades_file) as f:
+        with open(trades_file, encoding="utf-8") as f:
             lines = f.readlines()[-limit:]
             for line in reversed(lines):
                 try:
@@ -190,7 +190,7 @@ def get_strategy_stats():
     trades_file = DATA_DIR / "trades.jsonl"
     
     if trades_file.exists():
-        with open(trades_file) as f:
+        with open(trades_file, encoding="utf-8") as f:
             for line in f:
                 try:
                     trade = json.loads(line)
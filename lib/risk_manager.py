@@ -50,7 +50,7 @@ class RiskConfig:
     min_liquidity: float = 1000.0     # Skip markets with less liquidity
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TrackedPosition:
     """A position tracked by the risk manager."""
     id: str
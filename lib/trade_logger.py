@@ -8,13 +8,14 @@ Logs every decision with:
 - Expected vs actual outcomes (for learning)
 """
 
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import logging
 
+from src.http import json_line, json_loads
+
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path("data")
@@ -62,8 +63,8 @@ def log_trade_decision(
         "expected_edge": expected_edge
     }
     
-    with open(TRADE_LOG, "a") as f:
-        f.write(json.dumps(record) + "\n")
+    with open(TRADE_LOG, "ab") as f:
+        f.write(json_line(record))
     
     # Also log to standard logger for visibility
     if action != "PASS":
@@ -250,8 +251,8 @@ def flag_for_review(
         "reviewed": False
     }
     
-    with open(REVIEW_LOG, "a") as f:
-        f.write(json.dumps(record) + "\n")
+    with open(REVIEW_LOG, "ab") as f:
+        f.write(json_line(record))
     
     logger.warning(f"[REVIEW] {severity.upper()}: {issue_type} - {description}")
 
@@ -260,12 +261,12 @@ def get_recent_decisions(limit: int = 50) -> List[Dict[str, Any]]:
     """Get recent trade decisions for review."""
     decisions = []
     if TRADE_LOG.exists():
-        with open(TRADE_LOG) as f:
+        with open(TRADE_LOG, "rb") as f:
             lines = f.readlines()[-limit:]
             for line in lines:
                 try:
-                    decisions.append(json.loads(line))
-                except json.JSONDecodeError:
+                    decisions.append(json_loads(line))
+                except ValueError:
                     continue
     return decisions
 
@@ -274,12 +275,12 @@ def get_review_flags(unreviewed_only: bool = True) -> List[Dict[str, Any]]:
     """Get flags that need review."""
     flags = []
     if REVIEW_LOG.exists():
-        with open(REVIEW_LOG) as f:
+        with open(REVIEW_LOG, "rb") as f:
             for line in f:
                 try:
-                    flag = json.loads(line)
+                    flag = json_loads(line)
                     if not unreviewed_only or not flag.get("reviewed"):
                         flags.append(flag)
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
     return flags
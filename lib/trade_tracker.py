@@ -7,13 +7,14 @@ Logs:
 - daily_summary.json: Daily aggregated stats
 """
 
-import json
 import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
+from src.http import json_line, json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -148,24 +149,35 @@ class TradeTracker:
         
         trades = []
         if self.trades_file.exists():
-            with open(self.trades_file) as f:
+            with open(self.trades_file, "rb") as f:
                 for line in f:
                     try:
-                        record = json.loads(line)
+                        record = json_loads(line)
                         if record.get("timestamp", "").startswith(today):
                             trades.append(record)
-                    except json.JSONDecodeError:
+                    except ValueError:
                         continue
         
-        entries = [t for t in trades if t.get("type") == "ENTRY"]
-        exits = [t for t in trades if t.get("type") == "EXIT"]
+        # Split and total in one pass rather than two filters and two sums
+        entries = []
+        exits = []
+        total_pnl = 0
+        total_volume = 0
+        for t in trades:
+            trade_type = t.get("type")
+            if trade_type == "ENTRY":
+                entries.append(t)
+                total_volume += t.get("size_usd", 0)
+            elif trade_type == "EXIT":
+                exits.append(t)
+                total_pnl += t.get("pnl", 0)
         
         return {
             "date": today,
             "total_entries": len(entries),
             "total_exits": len(exits),
-            "total_pnl": sum(t.get("pnl", 0) for t in exits),
-            "total_volume": sum(t.get("size_usd", 0) for t in entries),
+            "total_pnl": total_pnl,
+            "total_volume": total_volume,
             "by_strategy": self._group_by_strategy(entries, exits),
             "by_signal_type": self._group_by_signal(entries)
         }
@@ -191,8 +203,8 @@ class TradeTracker:
     
     def _append_jsonl(self, filepath: Path, record: Dict[str, Any]):
         """Append a record to a JSONL file."""
-        with open(filepath, "a") as f:
-            f.write(json.dumps(record) + "\n")
+        with open(filepath, "ab") as f:
+            f.write(json_line(record))
 
 
 # Global tracker instance
@@ -9,6 +9,8 @@ Modes:
     1. Watch mode - monitor prices and show live orderbook
     2. Limit order mode - place orders at your target price
     3. Auto mode - buy when price drops below threshold, sell above
+       (live quotes come from scripts/wsbroker.py, which is started on demand
+       so several auto traders share one WebSocket connection)
 
 Usage:
     # Watch a market (monitor only, no trading)
@@ -23,10 +25,14 @@ Usage:
 
 import os
 import sys
+import json
 import asyncio
 import argparse
+import queue
+import threading
 import time
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -34,7 +40,15 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.market_search import MarketSearch
-from src.websocket_client import MarketWebSocket, OrderbookSnapshot
+from src.websocket_client import MarketWebSocket, OrderbookSnapshot, calc_mid_price
+from wsbroker import connect_to_broker, stream_quotes
+
+try:
+    from src.bot import TradingBot
+    from src.config import Config
+except ImportError:  # watch mode only needs market data
+    TradingBot = None
+    Config = None
 
 
 class Colors:
@@ -49,12 +63,155 @@ class Colors:
     RESET = "\033[0m"
 
 
+# When piped to a file or log collector, drop ANSI escapes and use a
+# compact status line
+IS_TTY = sys.stdout.isatty()
+if not IS_TTY:
+    Colors.GREEN = Colors.YELLOW = Colors.RED = Colors.BLUE = Colors.CYAN = ""
+    Colors.MAGENTA = Colors.BOLD = Colors.DIM = Colors.RESET = ""
+
+# auto_trade status line, built once instead of re-assembled every tick
+if IS_TTY:
+    STATUS_TEMPLATE = (
+        "  [{ts}] {status}  |  Price: {price:.4f}  |  "
+        "Trades: {trades}  |  PnL: ${pnl:+.2f}  |  "
+        "Unrealized: {ur_color}${unrealized:+.2f}" + Colors.RESET
+    )
+    HOLDING_STATUS = Colors.CYAN + "HOLDING @ {:.4f}" + Colors.RESET
+    WATCHING_STATUS = Colors.DIM + "WATCHING" + Colors.RESET
+else:
+    # ts status price trades pnl unrealized
+    STATUS_TEMPLATE = "{ts} {status} {price:.4f} {trades} {pnl:+.2f} {ur_color}{unrealized:+.2f}"
+    HOLDING_STATUS = "HOLDING@{:.4f}"
+    WATCHING_STATUS = "WATCHING"
+
+
+# Hot-path output (watch ticks, auto_trade signals/status) is written by a
+# daemon thread so a slow terminal can't stall the event loop. If the
+# terminal falls 1024 lines behind, new lines are dropped.
+_OUTPUT_QUEUE: "queue.Queue[str]" = queue.Queue(maxsize=1024)
+_output_thread: Optional[threading.Thread] = None
+
+
+def _drain_output() -> None:
+    while True:
+        line = _OUTPUT_QUEUE.get()
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        _OUTPUT_QUEUE.task_done()
+
+
+def emit(line: str) -> None:
+    """Queue a line for the output thread without blocking."""
+    global _output_thread
+    if _output_thread is None:
+        _output_thread = threading.Thread(target=_drain_output, name="stdout-writer", daemon=True)
+        _output_thread.start()
+    try:
+        _OUTPUT_QUEUE.put_nowait(line + "\n")
+    except queue.Full:
+        pass
+
+
+def flush_output() -> None:
+    """Block until queued output has been written (before summaries/exit)."""
+    if _output_thread is not None:
+        _OUTPUT_QUEUE.join()
+
+
+# Shared across subcommands so repeated lookups hit MarketSearch's TTL cache
+market_search = MarketSearch()
+
+# Last resolved select_market() result, reused when the same args recur
+SELECTION_CACHE = Path.home() / ".polymarket-trader" / "last_select.json"
+SELECTION_TTL = 600  # seconds
+QUOTE_MAX_AGE = 5.0  # seconds before auto_trade stops trading on a quote
+
+
+def start_bot() -> asyncio.Future:
+    """
+    Check credentials and start TradingBot initialization in a worker thread.
+
+    Returns a future so bot setup (key loading, API key derivation) runs
+    while the user is still picking a market.
+    """
+    private_key = os.environ.get("POLY_PRIVATE_KEY")
+    safe_address = os.environ.get("POLY_SAFE_ADDRESS")
+    if not private_key or not safe_address:
+        print(f"{Colors.RED}Set POLY_PRIVATE_KEY and POLY_SAFE_ADDRESS in .env{Colors.RESET}")
+        sys.exit(1)
+
+    if TradingBot is None:
+        print(f"{Colors.RED}Trading dependencies are not installed (pip install -r requirements.txt){Colors.RESET}")
+        sys.exit(1)
+
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(
+        None,
+        lambda: TradingBot(config=Config.from_env(), private_key=private_key),
+    )
+
+
+async def wait_for_bot(bot_future: asyncio.Future):
+    """Wait for a bot started by start_bot() and exit if it failed to initialize."""
+    bot = await bot_future
+    if not bot.is_initialized():
+        print(f"{Colors.RED}Bot failed to initialize{Colors.RESET}")
+        sys.exit(1)
+    return bot
+
+
+def _load_cached_selection(query: str, outcome: Optional[str], ttl: float = SELECTION_TTL) -> Optional[tuple]:
+    """
+    Return the saved (market, selected, token_id) if it matches and is fresh.
+
+    Only selections resolved without prompting are saved; a file without the
+    auto_resolved marker is treated as a miss.
+    """
+    try:
+        age = time.time() - SELECTION_CACHE.stat().st_mtime
+        if age > ttl:
+            return None
+        data = json.loads(SELECTION_CACHE.read_text())
+        if not data.get("auto_resolved") or data["query"] != query or data["outcome"] != outcome:
+            return None
+        return data["market"], data["selected"], data["token_id"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def _save_selection(query: str, outcome: Optional[str], market: dict, selected: str, token_id: str) -> None:
+    """Atomically persist a selection resolved without prompting; failures are ignored."""
+    data = {
+        "auto_resolved": True,
+        "query": query,
+        "outcome": outcome,
+        "market": market,
+        "selected": selected,
+        "token_id": token_id,
+        "ts": time.time(),
+    }
+    try:
+        SELECTION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = SELECTION_CACHE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, SELECTION_CACHE)
+    except OSError:
+        pass
+
+
 def select_market(query: str, outcome: str = None) -> tuple:
     """Search and let user select a market. Returns (market_dict, selected_outcome, token_id)."""
-    search = MarketSearch()
+    cached = _load_cached_selection(query, outcome)
+    if cached:
+        market, selected, token_id = cached
+        print(f"\n{Colors.GREEN}Using recent selection: {market['question']} → {selected.upper()}{Colors.RESET}")
+        print(f"  Token: {token_id[:30]}...")
+        return market, selected, token_id
+
     print(f"\n{Colors.CYAN}Searching for '{query}'...{Colors.RESET}")
 
-    markets = search.find_markets(query, limit=10)
+    markets = market_search.find_markets(query, limit=10)
     if not markets:
         print(f"{Colors.RED}No markets found.{Colors.RESET}")
         sys.exit(1)
@@ -79,31 +236,23 @@ def select_market(query: str, outcome: str = None) -> tuple:
             print("Cancelled.")
             sys.exit(0)
 
-    # Select outcome
+    # Select outcome (token_ids keys are already lower-cased by MarketSearch)
     outcomes = list(market["token_ids"].keys())
-    if outcome and outcome.lower() in market["token_ids"]:
-        selected = outcome.lower()
+    wanted = outcome.lower() if outcome else ""
+    exact_outcome = bool(wanted) and wanted in market["token_ids"]
+    if exact_outcome:
+        selected = wanted
     elif len(outcomes) == 1:
         selected = outcomes[0]
     else:
-        print(f"\n  Outcomes:")
-        for i, o in enumerate(outcomes, 1):
-            price = market["prices"].get(o, 0)
-            print(f"    {i}. {o.upper()} (current: {price:.2f})")
-
-        if outcome:
-            # Try partial match
-            for o in outcomes:
-                if outcome.lower() in o.lower():
-                    selected = o
-                    break
-            else:
-                try:
-                    choice = input(f"  Select outcome: ").strip()
-                    selected = outcomes[int(choice) - 1]
-                except (ValueError, IndexError):
-                    selected = outcomes[0]
-        else:
+        # Try partial match before prompting
+        selected = next((o for o in outcomes if wanted in o), None) if wanted else None
+        if selected is None:
+            print(f"\n  Outcomes:")
+            for i, o in enumerate(outcomes, 1):
+                price = market["prices"].get(o, 0)
+                print(f"    {i}. {o.upper()} (current: {price:.2f})")
+
             try:
                 choice = input(f"  Select outcome: ").strip()
                 selected = outcomes[int(choice) - 1]
@@ -114,31 +263,57 @@ def select_market(query: str, outcome: str = None) -> tuple:
     print(f"\n  {Colors.GREEN}Selected: {market['question']} → {selected.upper()}{Colors.RESET}")
     print(f"  Token: {token_id[:30]}...")
 
+    # Only remember selections that involved no interactive choice, so a
+    # later auto/buy run never silently trades a market picked by hand
+    if len(markets) == 1 and exact_outcome:
+        _save_selection(query, outcome, market, selected, token_id)
     return market, selected, token_id
 
 
 async def watch_market(query: str, outcome: str = None, refresh: float = 2.0):
-    """Watch mode: live price monitoring via REST polling."""
+    """
+    Watch mode: live price monitoring via REST polling.
+
+    Unlike auto_trade this doesn't go through the wsbroker: the display needs
+    the top five book levels for depth, while the broker only fans out
+    top-of-book quotes. It polls /book and opens no WebSocket of its own.
+    """
     market, selected, token_id = select_market(query, outcome)
-    search = MarketSearch()
 
     print(f"\n{Colors.BOLD}Watching {market['question']} → {selected.upper()}{Colors.RESET}")
     print(f"Press Ctrl+C to stop\n")
 
     prev_price = None
+    prev_top = None
+    delay = refresh
+    max_delay = refresh * 4
     while True:
         try:
-            book = search.get_orderbook(token_id)
+            book = await market_search.get_orderbook_async(token_id)
             if not book:
-                print(f"{Colors.YELLOW}No data{Colors.RESET}")
+                emit(f"{Colors.YELLOW}No data{Colors.RESET}")
                 await asyncio.sleep(refresh)
                 continue
 
             bids = book.get("bids", [])
             asks = book.get("asks", [])
 
-            best_bid = float(bids[0]["price"]) if bids else 0
-            best_ask = float(asks[0]["price"]) if asks else 1
+            # Parse the top five levels once; they drive change detection,
+            # best bid/ask and depth below
+            top_bids = tuple((float(b["price"]), float(b["size"])) for b in bids[:5])
+            top_asks = tuple((float(a["price"]), float(a["size"])) for a in asks[:5])
+
+            # Skip rendering and back off while the top of book is unchanged
+            top = (top_bids, top_asks)
+            if top == prev_top:
+                delay = min(delay * 1.5, max_delay)
+                await asyncio.sleep(delay)
+                continue
+            prev_top = top
+            delay = refresh
+
+            best_bid = top_bids[0][0] if top_bids else 0
+            best_ask = top_asks[0][0] if top_asks else 1
             mid = (best_bid + best_ask) / 2 if best_bid and best_ask < 1 else best_bid or best_ask
             spread = best_ask - best_bid
 
@@ -153,45 +328,33 @@ async def watch_market(query: str, outcome: str = None, refresh: float = 2.0):
             else:
                 arrow = " "
 
-            bid_depth = sum(float(b["size"]) for b in bids[:5])
-            ask_depth = sum(float(a["size"]) for a in asks[:5])
+            bid_depth = sum(level_size for _, level_size in top_bids)
+            ask_depth = sum(level_size for _, level_size in top_asks)
 
             ts = time.strftime("%H:%M:%S")
-            print(
+            emit(
                 f"  [{ts}] {arrow} Mid: {Colors.BOLD}{mid:.4f}{Colors.RESET} ({mid*100:.1f}%)  |  "
                 f"Bid: {Colors.GREEN}{best_bid:.4f}{Colors.RESET}  Ask: {Colors.RED}{best_ask:.4f}{Colors.RESET}  |  "
                 f"Spread: {spread:.4f}  |  Depth: {bid_depth:.0f}/{ask_depth:.0f}"
             )
 
             prev_price = mid
-            await asyncio.sleep(refresh)
+            await asyncio.sleep(delay)
 
         except KeyboardInterrupt:
             break
         except Exception as e:
-            print(f"{Colors.RED}Error: {e}{Colors.RESET}")
+            emit(f"{Colors.RED}Error: {e}{Colors.RESET}")
             await asyncio.sleep(refresh)
 
+    flush_output()
+
 
 async def place_order(query, outcome, price, size, side):
     """Place a single order on a market."""
+    bot_future = start_bot()
     market, selected, token_id = select_market(query, outcome)
-
-    private_key = os.environ.get("POLY_PRIVATE_KEY")
-    safe_address = os.environ.get("POLY_SAFE_ADDRESS")
-    if not private_key or not safe_address:
-        print(f"{Colors.RED}Set POLY_PRIVATE_KEY and POLY_SAFE_ADDRESS in .env{Colors.RESET}")
-        sys.exit(1)
-
-    from src.bot import TradingBot
-    from src.config import Config
-
-    config = Config.from_env()
-    bot = TradingBot(config=config, private_key=private_key)
-
-    if not bot.is_initialized():
-        print(f"{Colors.RED}Bot failed to initialize{Colors.RESET}")
-        sys.exit(1)
+    bot = await wait_for_bot(bot_future)
 
     cost = price * size
     print(f"\n{Colors.BOLD}Order:{Colors.RESET}")
@@ -218,30 +381,15 @@ async def place_order(query, outcome, price, size, side):
 
 async def auto_trade(query, outcome, buy_below, sell_above, size, check_interval=5.0):
     """Auto-trade: buy when price drops below threshold, sell when it rises above."""
+    bot_future = start_bot()
     market, selected, token_id = select_market(query, outcome)
-
-    private_key = os.environ.get("POLY_PRIVATE_KEY")
-    safe_address = os.environ.get("POLY_SAFE_ADDRESS")
-    if not private_key or not safe_address:
-        print(f"{Colors.RED}Set POLY_PRIVATE_KEY and POLY_SAFE_ADDRESS in .env{Colors.RESET}")
-        sys.exit(1)
-
-    from src.bot import TradingBot
-    from src.config import Config
-
-    config = Config.from_env()
-    bot = TradingBot(config=config, private_key=private_key)
-    search = MarketSearch()
-
-    if not bot.is_initialized():
-        print(f"{Colors.RED}Bot failed to initialize{Colors.RESET}")
-        sys.exit(1)
+    bot = await wait_for_bot(bot_future)
 
     print(f"\n{Colors.BOLD}Auto-Trading: {market['question']} → {selected.upper()}{Colors.RESET}")
     print(f"  Buy below:  {buy_below:.4f} ({buy_below*100:.1f}%)")
     print(f"  Sell above: {sell_above:.4f} ({sell_above*100:.1f}%)")
     print(f"  Size: {size:.1f} shares per trade")
-    print(f"  Checking every {check_interval:.0f}s")
+    print(f"  Status every {check_interval:.0f}s (signals checked on every book update)")
     print(f"\n{Colors.YELLOW}Press Ctrl+C to stop{Colors.RESET}\n")
 
     holding = False  # Track if we have a position
@@ -249,11 +397,122 @@ async def auto_trade(query, outcome, buy_below, sell_above, size, check_interval
     trades = 0
     total_pnl = 0.0
 
+    # Signals are evaluated on every WebSocket update instead of polling,
+    # so an order fires as soon as the book crosses a threshold. Each quote
+    # carries its receive time so a stalled feed can't trade on an old price
+    latest = {
+        "price": await market_search.get_market_price_async(token_id),
+        "at": time.monotonic(),
+    }
+    price_updated = asyncio.Event()
+
+    def on_quote(asset_id: str, mid: float) -> None:
+        if asset_id == token_id:
+            latest["price"] = mid
+            latest["at"] = time.monotonic()
+            price_updated.set()
+
+    # Prefer the shared local broker so several traders use one WebSocket;
+    # fall back to a private connection where unix sockets aren't available
+    ws = None
+    feed = await connect_to_broker([token_id])
+    if feed:
+        feed_task = asyncio.create_task(stream_quotes(feed, [token_id], on_quote))
+    else:
+        ws = MarketWebSocket()
+
+        @ws.on_book
+        def on_book(snapshot: OrderbookSnapshot):
+            on_quote(snapshot.asset_id, snapshot.mid_price)
+
+        @ws.on_price_change
+        def on_price_change(market_id, changes):
+            for change in changes:
+                on_quote(change.asset_id, calc_mid_price(change.best_bid, change.best_ask))
+
+        await ws.subscribe([token_id])
+        feed_task = asyncio.create_task(ws.run(auto_reconnect=True))
+    last_status_print = 0.0
+
+    # Orders run as background tasks so price updates keep being processed
+    # while an order is signed and submitted. After a failed order, signals
+    # are ignored for check_interval so a persistent rejection can't turn
+    # every quote into a new order
+    pending_order: Optional[asyncio.Task] = None
+    retry_after = 0.0
+
+    def order_failed(message: str) -> None:
+        nonlocal retry_after
+        retry_after = time.monotonic() + check_interval
+        emit(message)
+
+    def on_buy_done(task: asyncio.Task, price: float, ts: str) -> None:
+        nonlocal holding, entry_price, trades
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            order_failed(f"  [{ts}] {Colors.RED}✗ Buy failed: {exc}{Colors.RESET}")
+            return
+        result = task.result()
+        if result.success:
+            holding = True
+            entry_price = price
+            trades += 1
+            emit(f"  [{ts}] {Colors.GREEN}✓ Bought @ {price:.4f}{Colors.RESET} (order: {result.order_id})")
+        else:
+            order_failed(f"  [{ts}] {Colors.RED}✗ Buy failed: {result.message}{Colors.RESET}")
+
+    def on_sell_done(task: asyncio.Task, price: float, pnl: float, ts: str) -> None:
+        nonlocal holding, total_pnl
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            order_failed(f"  [{ts}] {Colors.RED}✗ Sell failed: {exc}{Colors.RESET}")
+            return
+        result = task.result()
+        if result.success:
+            holding = False
+            total_pnl += pnl
+            pnl_color = Colors.GREEN if pnl >= 0 else Colors.RED
+            emit(f"  [{ts}] {Colors.GREEN}✓ Sold @ {price:.4f}{Colors.RESET} PnL: {pnl_color}${pnl:+.2f}{Colors.RESET}")
+        else:
+            order_failed(f"  [{ts}] {Colors.RED}✗ Sell failed: {result.message}{Colors.RESET}")
+
     while True:
         try:
-            price = search.get_market_price(token_id)
+            try:
+                await asyncio.wait_for(price_updated.wait(), timeout=check_interval)
+            except asyncio.TimeoutError:
+                pass
+            price_updated.clear()
+
+            # A quiet book sends no updates, so refresh over REST once the
+            # last quote is too old rather than trading on it
+            if time.monotonic() - latest["at"] > QUOTE_MAX_AGE:
+                refreshed = await market_search.get_market_price_async(token_id)
+                if refreshed is not None:
+                    latest["price"] = refreshed
+                    latest["at"] = time.monotonic()
+
+            price = latest["price"]
             if price is None:
-                await asyncio.sleep(check_interval)
+                continue
+
+            age = time.monotonic() - latest["at"]
+            if age > QUOTE_MAX_AGE:
+                if time.monotonic() - last_status_print >= check_interval:
+                    last_status_print = time.monotonic()
+                    emit(f"  [{time.strftime('%H:%M:%S')}] {Colors.YELLOW}STALE{Colors.RESET} "
+                         f"Price: {price:.4f} ({age:.0f}s old) - not trading")
+                continue
+
+            # Don't act on signals while an order is still in flight or
+            # while backing off after a failed one
+            if pending_order is not None and not pending_order.done():
+                continue
+            if time.monotonic() < retry_after:
                 continue
 
             ts = time.strftime("%H:%M:%S")
@@ -261,60 +520,58 @@ async def auto_trade(query, outcome, buy_below, sell_above, size, check_interval
             if not holding and price <= buy_below:
                 # Buy signal
                 buy_price = min(price + 0.02, 0.99)
-                print(f"  [{ts}] {Colors.GREEN}BUY SIGNAL{Colors.RESET} - Price {price:.4f} <= {buy_below:.4f}")
+                emit(f"  [{ts}] {Colors.GREEN}BUY SIGNAL{Colors.RESET} - Price {price:.4f} <= {buy_below:.4f}")
 
-                result = await bot.place_order(
+                pending_order = asyncio.create_task(bot.place_order(
                     token_id=token_id,
                     price=buy_price,
                     size=size,
                     side="BUY",
+                ))
+                pending_order.add_done_callback(
+                    lambda task, price=price, ts=ts: on_buy_done(task, price, ts)
                 )
 
-                if result.success:
-                    holding = True
-                    entry_price = price
-                    trades += 1
-                    print(f"  [{ts}] {Colors.GREEN}✓ Bought @ {price:.4f}{Colors.RESET} (order: {result.order_id})")
-                else:
-                    print(f"  [{ts}] {Colors.RED}✗ Buy failed: {result.message}{Colors.RESET}")
-
             elif holding and price >= sell_above:
                 # Sell signal
                 sell_price = max(price - 0.02, 0.01)
                 pnl = (price - entry_price) * size
-                total_pnl += pnl
 
-                print(f"  [{ts}] {Colors.RED}SELL SIGNAL{Colors.RESET} - Price {price:.4f} >= {sell_above:.4f}")
+                emit(f"  [{ts}] {Colors.RED}SELL SIGNAL{Colors.RESET} - Price {price:.4f} >= {sell_above:.4f}")
 
-                result = await bot.place_order(
+                pending_order = asyncio.create_task(bot.place_order(
                     token_id=token_id,
                     price=sell_price,
                     size=size,
                     side="SELL",
+                ))
+                pending_order.add_done_callback(
+                    lambda task, price=price, pnl=pnl, ts=ts: on_sell_done(task, price, pnl, ts)
                 )
 
-                if result.success:
-                    holding = False
-                    pnl_color = Colors.GREEN if pnl >= 0 else Colors.RED
-                    print(f"  [{ts}] {Colors.GREEN}✓ Sold @ {price:.4f}{Colors.RESET} PnL: {pnl_color}${pnl:+.2f}{Colors.RESET}")
+            elif time.monotonic() - last_status_print >= check_interval:
+                # No signal - log status at most once per check_interval
+                last_status_print = time.monotonic()
+                if holding:
+                    status = HOLDING_STATUS.format(entry_price)
+                    unrealized = (price - entry_price) * size
                 else:
-                    print(f"  [{ts}] {Colors.RED}✗ Sell failed: {result.message}{Colors.RESET}")
-
-            else:
-                # No signal - log status
-                status = f"{Colors.CYAN}HOLDING @ {entry_price:.4f}{Colors.RESET}" if holding else f"{Colors.DIM}WATCHING{Colors.RESET}"
-                unrealized = (price - entry_price) * size if holding else 0
+                    status = WATCHING_STATUS
+                    unrealized = 0.0
                 ur_color = Colors.GREEN if unrealized >= 0 else Colors.RED
 
-                print(
-                    f"  [{ts}] {status}  |  Price: {price:.4f}  |  "
-                    f"Trades: {trades}  |  PnL: ${total_pnl:+.2f}  |  "
-                    f"Unrealized: {ur_color}${unrealized:+.2f}{Colors.RESET}"
-                )
-
-            await asyncio.sleep(check_interval)
+                emit(STATUS_TEMPLATE.format(
+                    ts=ts,
+                    status=status,
+                    price=price,
+                    trades=trades,
+                    pnl=total_pnl,
+                    ur_color=ur_color,
+                    unrealized=unrealized,
+                ))
 
         except KeyboardInterrupt:
+            flush_output()
             print(f"\n\n{Colors.BOLD}Session Summary:{Colors.RESET}")
             print(f"  Trades: {trades}")
             print(f"  Realized PnL: ${total_pnl:+.2f}")
@@ -322,9 +579,15 @@ async def auto_trade(query, outcome, buy_below, sell_above, size, check_interval
                 print(f"  {Colors.YELLOW}Warning: Still holding a position!{Colors.RESET}")
             break
         except Exception as e:
-            print(f"  {Colors.RED}Error: {e}{Colors.RESET}")
+            emit(f"  {Colors.RED}Error: {e}{Colors.RESET}")
             await asyncio.sleep(check_interval)
 
+    flush_output()
+    feed_task.cancel()
+    if ws:
+        ws.stop()
+        await ws.disconnect()
+
 
 def main():
     parser = argparse.ArgumentParser(description="General Market Trader for Polymarket")
@@ -357,7 +620,7 @@ def main():
     auto_parser.add_argument("--buy-below", type=float, required=True, help="Buy when price drops below this")
     auto_parser.add_argument("--sell-above", type=float, required=True, help="Sell when price rises above this")
     auto_parser.add_argument("--size", type=float, default=10.0, help="Shares per trade")
-    auto_parser.add_argument("--interval", type=float, default=5.0, help="Check interval (seconds)")
+    auto_parser.add_argument("--interval", type=float, default=5.0, help="Status print interval (seconds)")
 
     args = parser.parse_args()
 
@@ -386,6 +649,7 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
+        flush_output()
         print("\nDone.")
     except Exception as e:
         print(f"\n{Colors.RED}Error: {e}{Colors.RESET}")
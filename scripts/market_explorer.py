@@ -37,6 +37,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.market_search import MarketSearch
 
+try:
+    from src.bot import TradingBot
+    from src.config import Config
+except ImportError:  # search/browse commands only need market data
+    TradingBot = None
+    Config = None
+
 
 class Colors:
     GREEN = "\033[92m"
@@ -106,38 +113,39 @@ def print_events(events):
 
 def print_orderbook(book, levels=10):
     """Print orderbook in a readable format."""
-    bids = book.get("bids", [])
-    asks = book.get("asks", [])
+    # Parse only the levels we display, once
+    bids = [(float(b["price"]), float(b["size"])) for b in book.get("bids", [])[:levels]]
+    asks = [(float(a["price"]), float(a["size"])) for a in book.get("asks", [])[:levels]]
 
     print(f"\n{Colors.BOLD}{'BIDS':>25}  |  {'ASKS':<25}{Colors.RESET}")
     print(f"{'Price':>12} {'Size':>12}  |  {'Price':<12} {'Size':<12}")
     print("-" * 55)
 
-    for i in range(min(levels, max(len(bids), len(asks)))):
+    for i in range(max(len(bids), len(asks))):
         bid_str = ""
         ask_str = ""
 
         if i < len(bids):
-            bid_str = f"{Colors.GREEN}{float(bids[i]['price']):>12.4f} {float(bids[i]['size']):>12.1f}{Colors.RESET}"
+            bid_str = f"{Colors.GREEN}{bids[i][0]:>12.4f} {bids[i][1]:>12.1f}{Colors.RESET}"
         else:
             bid_str = f"{'':>12} {'':>12}"
 
         if i < len(asks):
-            ask_str = f"{Colors.RED}{float(asks[i]['price']):<12.4f} {float(asks[i]['size']):<12.1f}{Colors.RESET}"
+            ask_str = f"{Colors.RED}{asks[i][0]:<12.4f} {asks[i][1]:<12.1f}{Colors.RESET}"
         else:
             ask_str = f"{'':>12} {'':>12}"
 
         print(f"{bid_str}  |  {ask_str}")
 
     if bids and asks:
-        spread = float(asks[0]["price"]) - float(bids[0]["price"])
-        mid = (float(asks[0]["price"]) + float(bids[0]["price"])) / 2
+        spread = asks[0][0] - bids[0][0]
+        mid = (asks[0][0] + bids[0][0]) / 2
         print(f"\n  Mid: {mid:.4f}  |  Spread: {spread:.4f}")
 
 
-async def interactive_trade(query):
+async def interactive_trade(query, search=None):
     """Interactive mode: search, select a market, and trade."""
-    search = MarketSearch()
+    search = search or MarketSearch()
 
     # Search
     print(f"\n{Colors.CYAN}Searching for '{query}'...{Colors.RESET}")
@@ -166,9 +174,10 @@ async def interactive_trade(query):
 
     # Show orderbooks for each outcome
     print(f"\n{Colors.BOLD}Live Orderbooks:{Colors.RESET}")
+    books = search.get_orderbooks(list(market["token_ids"].values()))
     for outcome, tid in market["token_ids"].items():
         print(f"\n{Colors.BOLD}{outcome.upper()}{Colors.RESET} (token: {tid[:20]}...)")
-        book = search.get_orderbook(tid)
+        book = books.get(tid)
         if book:
             print_orderbook(book, levels=5)
 
@@ -183,6 +192,16 @@ async def interactive_trade(query):
             print(f"  {outcome.upper()}: {tid}")
         return
 
+    if TradingBot is None:
+        print(f"\n{Colors.RED}Trading dependencies are not installed (pip install -r requirements.txt){Colors.RESET}")
+        return
+
+    # Initialize the bot in the background while the order is being entered
+    bot_future = asyncio.get_running_loop().run_in_executor(
+        None,
+        lambda: TradingBot(config=Config.from_env(), private_key=private_key),
+    )
+
     # Offer to trade
     print(f"\n{Colors.BOLD}Place an order?{Colors.RESET}")
     for i, (outcome, tid) in enumerate(market["token_ids"].items(), 1):
@@ -224,11 +243,7 @@ async def interactive_trade(query):
             return
 
         # Execute trade
-        from src.bot import TradingBot
-        from src.config import Config
-
-        config = Config.from_env()
-        bot = TradingBot(config=config, private_key=private_key)
+        bot = await bot_future
 
         if not bot.is_initialized():
             print(f"{Colors.RED}Bot failed to initialize{Colors.RESET}")
@@ -327,7 +342,7 @@ def main():
             print(f"{Colors.RED}Failed to get orderbook{Colors.RESET}")
 
     elif args.command == "trade":
-        asyncio.run(interactive_trade(args.query))
+        asyncio.run(interactive_trade(args.query, search))
 
 
 if __name__ == "__main__":
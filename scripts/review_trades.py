@@ -11,91 +11,167 @@ Run hourly to:
 Output: Markdown report suitable for Telegram/logging
 """
 
-import json
+import io
+import mmap
+import os
+import re
 import sys
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.http import json_loads
 
 DATA_DIR = Path("data")
 TRADE_LOG = DATA_DIR / "trade_reasoning.jsonl"
 TRADES_FILE = DATA_DIR / "trades.jsonl"
 REVIEW_LOG = DATA_DIR / "review_flags.jsonl"
 
+_TIMESTAMP_KEY = b'"timestamp":'
+_TIMESTAMP_RE = re.compile(rb'"timestamp":\s*"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})')
+_FAILURE_RE = re.compile(r"error|fail", re.IGNORECASE)
+
+
+def _timestamp_prefix(line: bytes) -> Optional[bytes]:
+    """
+    Return the YYYY-MM-DDTHH:MM:SS part of a record's timestamp without parsing JSON.
+
+    Returns None unless the first "timestamp" key holds an ISO-8601 string,
+    so a number, null or differently formatted value is skipped rather than
+    compared against the cutoff.
+    """
+    idx = line.find(_TIMESTAMP_KEY)
+    if idx < 0:
+        return None
+    match = _TIMESTAMP_RE.match(line, idx)
+    return match.group(1) if match else None
+
+
+def _iter_lines_reversed(path: Path) -> Iterator[bytes]:
+    """
+    Yield the lines of a file from last to first.
+
+    The file is memory-mapped read-only and line boundaries are found with
+    rfind, so only the lines actually consumed are copied out.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while True:
+                start = mm.rfind(b"\n", 0, end)
+                yield mm[start + 1:end]
+                if start < 0:
+                    return
+                end = start
+
+
+def _load_since(path: Path, hours: int) -> List[Dict[str, Any]]:
+    """
+    Load JSONL records from the last N hours, oldest first.
+
+    The logs are append-only and time-ordered, so the file is scanned from
+    the end and reading stops at the first record older than the cutoff.
+    Timestamps are UTC ISO-8601 strings, which sort lexicographically, so
+    that check is a byte compare done before any JSON parsing.
+
+    This keeps each review proportional to the window without a sidecar
+    offset index that would have to be kept in sync with the log.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+    cutoff_iso = cutoff.strftime("%Y-%m-%dT%H:%M:%S").encode()
+    records = []
+
+    if path.exists():
+        for line in _iter_lines_reversed(path):
+            ts = _timestamp_prefix(line)
+            if ts is None:
+                continue
+            if ts < cutoff_iso:
+                break
+            try:
+                records.append(json_loads(line))
+            except ValueError:
+                continue
+
+    records.reverse()
+    return records
+
 
 def load_recent_decisions(hours: int = 1) -> List[Dict[str, Any]]:
     """Load decisions from the last N hours."""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    decisions = []
-    
-    if TRADE_LOG.exists():
-        with open(TRADE_LOG) as f:
-            for line in f:
-                try:
-                    d = json.loads(line)
-                    ts = datetime.fromisoformat(d["timestamp"].replace("Z", "+00:00"))
-                    if ts > cutoff:
-                        decisions.append(d)
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    continue
-    
-    return decisions
+    return _load_since(TRADE_LOG, hours)
 
 
 def load_recent_trades(hours: int = 24) -> List[Dict[str, Any]]:
     """Load actual trades from the last N hours."""
-    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-    trades = []
-    
-    if TRADES_FILE.exists():
-        with open(TRADES_FILE) as f:
-            for line in f:
-                try:
-                    t = json.loads(line)
-                    ts = datetime.fromisoformat(t["timestamp"].replace("Z", "+00:00"))
-                    if ts > cutoff:
-                        trades.append(t)
-                except (json.JSONDecodeError, KeyError, ValueError):
-                    continue
-    
-    return trades
+    return _load_since(TRADES_FILE, hours)
 
 
 def analyze_decisions(decisions: List[Dict]) -> Dict[str, Any]:
-    """Analyze decision patterns."""
+    """
+    Analyze decision patterns.
+
+    All per-decision aggregates, including the failure and low-confidence
+    tallies used by check_for_issues, are collected in this one pass.
+    """
     if not decisions:
-        return {"total": 0, "by_strategy": {}, "by_action": {}}
+        return {"total": 0, "by_strategy": {}, "by_action": {}, "pass_count": 0, "failures": {}, "low_confidence": 0}
     
-    by_strategy = {}
-    by_action = {"BUY": 0, "SELL": 0, "PASS": 0}
+    by_strategy = Counter()
+    by_action = Counter({"BUY": 0, "SELL": 0, "PASS": 0})
+    failures = Counter()
     confidence_sum = 0
     edge_sum = 0
+    pass_count = 0
+    low_conf_count = 0
     
     for d in decisions:
-        strat = d.get("strategy", "unknown")
-        action = d.get("action", "PASS")
-        
-        by_strategy[strat] = by_strategy.get(strat, 0) + 1
-        by_action[action] = by_action.get(action, 0) + 1
-        confidence_sum += d.get("confidence", 0)
-        edge_sum += d.get("expected_edge", 0)
+        get = d.get
+        action = get("action")
+        by_strategy[get("strategy", "unknown")] += 1
+        by_action[get("action", "PASS")] += 1
+        confidence_sum += get("confidence", 0)
+        edge_sum += get("expected_edge", 0)
+        if action == "PASS":
+            pass_count += 1
+        elif get("confidence", 1) < 0.3:
+            low_conf_count += 1
+        if _FAILURE_RE.search(get("reasoning", "")):
+            failures[get("market", "unknown")[:30]] += 1
     
     return {
         "total": len(decisions),
-        "by_strategy": by_strategy,
-        "by_action": by_action,
+        "by_strategy": dict(by_strategy),
+        "by_action": dict(by_action),
         "avg_confidence": confidence_sum / len(decisions),
-        "avg_expected_edge": edge_sum / len(decisions)
+        "avg_expected_edge": edge_sum / len(decisions),
+        "pass_count": pass_count,
+        "failures": dict(failures),
+        "low_confidence": low_conf_count,
     }
 
 
-def check_for_issues(decisions: List[Dict], trades: List[Dict]) -> List[Dict]:
+def check_for_issues(
+    decisions: List[Dict],
+    trades: List[Dict],
+    analysis: Optional[Dict[str, Any]] = None,
+) -> List[Dict]:
     """Check for potential issues that need review."""
     issues = []
+    if analysis is None:
+        analysis = analyze_decisions(decisions)
+    failures = analysis["failures"]
+    low_conf_count = analysis["low_confidence"]
+    pass_count = analysis["pass_count"]
     
     # Issue 1: High pass rate (not finding opportunities)
     if decisions:
-        pass_rate = sum(1 for d in decisions if d.get("action") == "PASS") / len(decisions)
+        pass_rate = pass_count / len(decisions)
         if pass_rate > 0.99:
             issues.append({
                 "type": "high_pass_rate",
@@ -104,12 +180,6 @@ def check_for_issues(decisions: List[Dict], trades: List[Dict]) -> List[Dict]:
             })
     
     # Issue 2: Repeated failures on same market
-    failures = {}
-    for d in decisions:
-        if "error" in d.get("reasoning", "").lower() or "fail" in d.get("reasoning", "").lower():
-            market = d.get("market", "unknown")[:30]
-            failures[market] = failures.get(market, 0) + 1
-    
     for market, count in failures.items():
         if count >= 3:
             issues.append({
@@ -118,9 +188,8 @@ def check_for_issues(decisions: List[Dict], trades: List[Dict]) -> List[Dict]:
                 "description": f"Market '{market}' failed {count} times"
             })
     
-    # Issue 3: No trades in extended period
-    entries = [t for t in trades if t.get("type") == "ENTRY"]
-    if len(entries) == 0 and len(decisions) > 10:
+    # Issue 3: No trades in extended period (stops at the first entry)
+    if len(decisions) > 10 and not any(t.get("type") == "ENTRY" for t in trades):
         issues.append({
             "type": "no_trades",
             "severity": "info",
@@ -128,12 +197,11 @@ def check_for_issues(decisions: List[Dict], trades: List[Dict]) -> List[Dict]:
         })
     
     # Issue 4: Low confidence trades
-    low_conf = [d for d in decisions if d.get("action") != "PASS" and d.get("confidence", 1) < 0.3]
-    if len(low_conf) > 3:
+    if low_conf_count > 3:
         issues.append({
             "type": "low_confidence_trades",
             "severity": "warning", 
-            "description": f"{len(low_conf)} trades with confidence < 30%"
+            "description": f"{low_conf_count} trades with confidence < 30%"
         })
     
     return issues
@@ -141,26 +209,37 @@ def check_for_issues(decisions: List[Dict], trades: List[Dict]) -> List[Dict]:
 
 def calculate_performance(trades: List[Dict]) -> Dict[str, Any]:
     """Calculate performance metrics."""
-    entries = [t for t in trades if t.get("type") == "ENTRY"]
-    exits = [t for t in trades if t.get("type") == "EXIT"]
-    
-    total_volume = sum(t.get("size_usd", 0) for t in entries)
-    total_pnl = sum(t.get("pnl", 0) for t in exits)
-    
-    wins = sum(1 for t in exits if t.get("pnl", 0) > 0)
-    losses = sum(1 for t in exits if t.get("pnl", 0) <= 0)
-    
+    total_entries = total_exits = 0
+    total_volume = total_pnl = 0
+    wins = losses = 0
     by_strategy = {}
-    for t in entries:
-        strat = t.get("strategy", "unknown")
-        if strat not in by_strategy:
-            by_strategy[strat] = {"trades": 0, "volume": 0}
-        by_strategy[strat]["trades"] += 1
-        by_strategy[strat]["volume"] += t.get("size_usd", 0)
+    
+    # Single pass over trades; entries and exits are never materialized
+    for t in trades:
+        get = t.get
+        trade_type = get("type")
+        if trade_type == "ENTRY":
+            size_usd = get("size_usd", 0)
+            total_entries += 1
+            total_volume += size_usd
+            strat = get("strategy", "unknown")
+            stats = by_strategy.get(strat)
+            if stats is None:
+                stats = by_strategy[strat] = {"trades": 0, "volume": 0}
+            stats["trades"] += 1
+            stats["volume"] += size_usd
+        elif trade_type == "EXIT":
+            pnl = get("pnl", 0)
+            total_exits += 1
+            total_pnl += pnl
+            if pnl > 0:
+                wins += 1
+            else:
+                losses += 1
     
     return {
-        "total_entries": len(entries),
-        "total_exits": len(exits),
+        "total_entries": total_entries,
+        "total_exits": total_exits,
         "total_volume": total_volume,
         "total_pnl": total_pnl,
         "wins": wins,
@@ -176,61 +255,63 @@ def generate_report(hours: int = 1) -> str:
     trades = load_recent_trades(24)  # 24h for performance context
     
     analysis = analyze_decisions(decisions)
-    issues = check_for_issues(decisions, trades)
+    issues = check_for_issues(decisions, trades, analysis)
     performance = calculate_performance(trades)
     
-    report = []
-    report.append(f"# 🤖 Trade Review Report")
-    report.append(f"**Period:** Last {hours} hour(s)")
-    report.append(f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
-    report.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# 🤖 Trade Review Report\n")
+    w(f"**Period:** Last {hours} hour(s)\n")
+    w(f"**Generated:** {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}\n")
+    w("\n")
     
     # Summary
-    report.append("## 📊 Summary")
-    report.append(f"- **Decisions evaluated:** {analysis['total']}")
-    report.append(f"- **Trades executed:** {analysis['by_action'].get('BUY', 0) + analysis['by_action'].get('SELL', 0)}")
-    report.append(f"- **Avg confidence:** {analysis.get('avg_confidence', 0)*100:.1f}%")
-    report.append(f"- **Avg expected edge:** {analysis.get('avg_expected_edge', 0)*100:.2f}%")
-    report.append("")
+    w("## 📊 Summary\n")
+    w(f"- **Decisions evaluated:** {analysis['total']}\n")
+    w(f"- **Trades executed:** {analysis['by_action'].get('BUY', 0) + analysis['by_action'].get('SELL', 0)}\n")
+    w(f"- **Avg confidence:** {analysis.get('avg_confidence', 0)*100:.1f}%\n")
+    w(f"- **Avg expected edge:** {analysis.get('avg_expected_edge', 0)*100:.2f}%\n")
+    w("\n")
     
     # By Strategy
-    report.append("## 🎯 By Strategy")
+    w("## 🎯 By Strategy\n")
     for strat, count in analysis["by_strategy"].items():
-        report.append(f"- **{strat}:** {count} decisions")
-    report.append("")
+        w(f"- **{strat}:** {count} decisions\n")
+    w("\n")
     
     # Performance (24h)
-    report.append("## 📈 Performance (24h)")
-    report.append(f"- **Total trades:** {performance['total_entries']}")
-    report.append(f"- **Volume:** ${performance['total_volume']:.2f}")
-    report.append(f"- **PnL:** ${performance['total_pnl']:+.2f}")
-    report.append(f"- **Win rate:** {performance['win_rate']*100:.1f}%")
-    report.append("")
+    w("## 📈 Performance (24h)\n")
+    w(f"- **Total trades:** {performance['total_entries']}\n")
+    w(f"- **Volume:** ${performance['total_volume']:.2f}\n")
+    w(f"- **PnL:** ${performance['total_pnl']:+.2f}\n")
+    w(f"- **Win rate:** {performance['win_rate']*100:.1f}%\n")
+    w("\n")
     
     # Issues
     if issues:
-        report.append("## ⚠️ Issues Detected")
+        w("## ⚠️ Issues Detected\n")
         for issue in issues:
             icon = "🔴" if issue["severity"] == "error" else "🟡" if issue["severity"] == "warning" else "🔵"
-            report.append(f"- {icon} **{issue['type']}:** {issue['description']}")
-        report.append("")
+            w(f"- {icon} **{issue['type']}:** {issue['description']}\n")
+        w("\n")
     else:
-        report.append("## ✅ No Issues Detected")
-        report.append("")
+        w("## ✅ No Issues Detected\n")
+        w("\n")
     
     # Recent Trade Reasoning (last 5)
-    report.append("## 📝 Recent Trade Reasoning")
+    w("## 📝 Recent Trade Reasoning\n")
     recent_buys = [d for d in decisions if d.get("action") == "BUY"][-5:]
     if recent_buys:
         for d in recent_buys:
-            report.append(f"**{d.get('strategy', '?')}** @ {d.get('timestamp', '?')[:19]}")
-            report.append(f"> {d.get('reasoning', 'No reasoning logged')}")
-            report.append("")
+            w(f"**{d.get('strategy', '?')}** @ {d.get('timestamp', '?')[:19]}\n")
+            w(f"> {d.get('reasoning', 'No reasoning logged')}\n")
+            w("\n")
     else:
-        report.append("*No recent BUY decisions*")
-        report.append("")
+        w("*No recent BUY decisions*\n")
+        w("\n")
     
-    return "\n".join(report)
+    # Drop the newline after the final blank line, matching the old "\n".join output
+    return buf.getvalue()[:-1]
 
 
 if __name__ == "__main__":
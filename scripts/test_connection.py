@@ -54,6 +54,143 @@ def section(title):
     print(f"\n{Colors.BOLD}{Colors.BLUE}[{title}]{Colors.RESET}")
 
 
+class SectionOutput:
+    """Buffers one check section so concurrent checks can print in order."""
+
+    def __init__(self, title):
+        self.title = title
+        self.lines = []
+        self.passed = 0
+        self.failed = 0
+        self.warnings = 0
+
+    def ok(self, msg, count=True):
+        self.lines.append(f"  {Colors.GREEN}✓{Colors.RESET} {msg}")
+        self.passed += count
+
+    def warn(self, msg):
+        self.lines.append(f"  {Colors.YELLOW}⚠{Colors.RESET} {msg}")
+        self.warnings += 1
+
+    def fail(self, msg):
+        self.lines.append(f"  {Colors.RED}✗{Colors.RESET} {msg}")
+        self.failed += 1
+
+    def note(self, msg):
+        self.lines.append(f"    {Colors.DIM}{msg}{Colors.RESET}")
+
+    def print(self):
+        section(self.title)
+        for line in self.lines:
+            print(line)
+
+
+async def check_public_api():
+    out = SectionOutput("4. Public API Connection")
+    import requests
+
+    async def get(url, **kwargs):
+        return await asyncio.to_thread(requests.get, url, timeout=10, **kwargs)
+
+    clob, gamma = await asyncio.gather(
+        get("https://clob.polymarket.com/book", params={"token_id": "0"}),
+        get("https://gamma-api.polymarket.com/markets?limit=1"),
+        return_exceptions=True,
+    )
+
+    if isinstance(clob, Exception):
+        out.fail(f"CLOB API unreachable: {clob}")
+    elif clob.status_code in (200, 400):
+        out.ok(f"CLOB API is reachable (status: {clob.status_code})")
+    else:
+        out.warn(f"CLOB API returned status {clob.status_code}")
+
+    if isinstance(gamma, Exception):
+        out.fail(f"Gamma API unreachable: {gamma}")
+    elif gamma.status_code == 200:
+        out.ok(f"Gamma API is reachable")
+    else:
+        out.fail(f"Gamma API returned status {gamma.status_code}")
+
+    return out
+
+
+async def check_market_search():
+    out = SectionOutput("5. Market Search")
+    try:
+        from src.market_search import MarketSearch
+        search = MarketSearch()
+        markets = await search.get_trending_async(limit=3)
+        if markets:
+            out.ok(f"Market search works ({len(markets)} trending markets found)")
+            # Live mids for every trending market in one CLOB request
+            token_ids = [m["token_id_list"][0] for m in markets[:3] if m["token_id_list"]]
+            mids = await search.get_market_prices_async(token_ids)
+            for m in markets[:3]:
+                prices = " | ".join(f"{k}: {v:.2f}" for k, v in m["prices"].items())
+                mid = mids.get(m["token_id_list"][0]) if m["token_id_list"] else None
+                mid_str = f"  mid {mid:.3f}" if mid is not None else ""
+                out.note(f"{m['question'][:60]}  [{prices}]{mid_str}")
+        else:
+            out.warn("Market search returned no results")
+    except Exception as e:
+        out.fail(f"Market search failed: {e}")
+    return out
+
+
+async def check_bot(private_key, safe_address):
+    """Bot initialization (6) followed by the authenticated API call (7)."""
+    bot_out = SectionOutput("6. Bot Initialization")
+    auth_out = SectionOutput("7. Authenticated API")
+    if not (private_key and safe_address):
+        bot_out.fail("Skipped (missing credentials)")
+        auth_out.fail("Skipped (missing credentials)")
+        return bot_out, auth_out
+
+    bot = None
+    try:
+        from src.bot import TradingBot
+        from src.config import Config
+
+        config = Config.from_env()
+        bot = await asyncio.to_thread(TradingBot, config=config, private_key=private_key)
+
+        if bot.is_initialized():
+            bot_out.ok("Bot initialized successfully")
+            bot_out.ok(f"Gasless mode: {'ENABLED' if config.use_gasless else 'DISABLED'}", count=False)
+        else:
+            bot_out.fail("Bot initialization returned False")
+    except Exception as e:
+        bot_out.fail(f"Bot initialization failed: {e}")
+
+    try:
+        orders = await bot.get_open_orders()
+        auth_out.ok(f"Authenticated API works ({len(orders)} open orders)")
+    except Exception as e:
+        auth_out.warn(f"Authenticated API failed: {e}")
+        auth_out.note("This may be normal if you haven't traded yet")
+
+    return bot_out, auth_out
+
+
+async def check_websocket():
+    out = SectionOutput("8. WebSocket Connection")
+    try:
+        from src.websocket_client import MarketWebSocket
+        ws = MarketWebSocket()
+        connected = await asyncio.wait_for(ws.connect(), timeout=10)
+        if connected:
+            out.ok("WebSocket connected successfully")
+            await ws.disconnect()
+        else:
+            out.fail("WebSocket connection failed")
+    except asyncio.TimeoutError:
+        out.fail("WebSocket connection timed out")
+    except Exception as e:
+        out.fail(f"WebSocket error: {e}")
+    return out
+
+
 async def main():
     print(f"\n{Colors.BOLD}{'='*60}{Colors.RESET}")
     print(f"{Colors.BOLD}  Polymarket Trading Bot - Connection Test{Colors.RESET}")
@@ -133,117 +270,21 @@ async def main():
         fail("Skipped (no address)")
         failed += 1
 
-    # 4. Public API (no auth)
-    section("4. Public API Connection")
-    try:
-        import requests
-        response = requests.get(
-            "https://clob.polymarket.com/book",
-            params={"token_id": "0"},
-            timeout=10
-        )
-        if response.status_code in (200, 400):
-            ok(f"CLOB API is reachable (status: {response.status_code})")
-            passed += 1
-        else:
-            warn(f"CLOB API returned status {response.status_code}")
-            warnings += 1
-    except Exception as e:
-        fail(f"CLOB API unreachable: {e}")
-        failed += 1
-
-    try:
-        response = requests.get(
-            "https://gamma-api.polymarket.com/markets?limit=1",
-            timeout=10
-        )
-        if response.status_code == 200:
-            ok(f"Gamma API is reachable")
-            passed += 1
-        else:
-            fail(f"Gamma API returned status {response.status_code}")
-            failed += 1
-    except Exception as e:
-        fail(f"Gamma API unreachable: {e}")
-        failed += 1
-
-    # 5. Market search
-    section("5. Market Search")
-    try:
-        from src.market_search import MarketSearch
-        search = MarketSearch()
-        markets = search.get_trending(limit=3)
-        if markets:
-            ok(f"Market search works ({len(markets)} trending markets found)")
-            for m in markets[:3]:
-                prices = " | ".join(f"{k}: {v:.2f}" for k, v in m["prices"].items())
-                print(f"    {Colors.DIM}{m['question'][:60]}  [{prices}]{Colors.RESET}")
-            passed += 1
-        else:
-            warn("Market search returned no results")
-            warnings += 1
-    except Exception as e:
-        fail(f"Market search failed: {e}")
-        failed += 1
-
-    # 6. Bot initialization
-    section("6. Bot Initialization")
-    if private_key and safe_address:
-        try:
-            from src.bot import TradingBot
-            from src.config import Config
-
-            config = Config.from_env()
-            bot = TradingBot(config=config, private_key=private_key)
-
-            if bot.is_initialized():
-                ok("Bot initialized successfully")
-                ok(f"Gasless mode: {'ENABLED' if config.use_gasless else 'DISABLED'}")
-                passed += 1
-            else:
-                fail("Bot initialization returned False")
-                failed += 1
-        except Exception as e:
-            fail(f"Bot initialization failed: {e}")
-            failed += 1
-    else:
-        fail("Skipped (missing credentials)")
-        failed += 1
-
-    # 7. Authenticated API
-    section("7. Authenticated API")
-    if private_key and safe_address:
-        try:
-            orders = await bot.get_open_orders()
-            ok(f"Authenticated API works ({len(orders)} open orders)")
-            passed += 1
-        except Exception as e:
-            warn(f"Authenticated API failed: {e}")
-            print(f"    {Colors.DIM}This may be normal if you haven't traded yet{Colors.RESET}")
-            warnings += 1
-    else:
-        fail("Skipped (missing credentials)")
-        failed += 1
-
-    # 8. WebSocket
-    section("8. WebSocket Connection")
-    try:
-        from src.websocket_client import MarketWebSocket
-        ws = MarketWebSocket()
-        connected = await asyncio.wait_for(ws.connect(), timeout=10)
-        if connected:
-            ok("WebSocket connected successfully")
-            await ws.disconnect()
-            passed += 1
-        else:
-            fail("WebSocket connection failed")
-            failed += 1
-    except asyncio.TimeoutError:
-        fail("WebSocket connection timed out")
-        failed += 1
-    except Exception as e:
-        fail(f"WebSocket error: {e}")
-        failed += 1
+    # 4-8. Network checks are independent, so run them concurrently (the
+    # WebSocket handshake overlaps the HTTP probes) and print each section's
+    # buffered output in order afterwards
+    outputs = await asyncio.gather(
+        check_public_api(),
+        check_market_search(),
+        check_bot(private_key, safe_address),
+        check_websocket(),
+    )
+    bot_output, auth_output = outputs[2]
+    for output in (outputs[0], outputs[1], bot_output, auth_output, outputs[3]):
+        output.print()
+        passed += output.passed
+        failed += output.failed
+        warnings += output.warnings
 
     # Summary
     total = passed + failed + warnings
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+WebSocket Broker - Share one market WebSocket between local processes
+
+Running `general_trader.py auto` in several terminals would otherwise open
+one Polymarket WebSocket per process. The broker keeps a single
+MarketWebSocket and fans quotes out to local subscribers over a unix
+domain socket.
+
+Protocol (newline-delimited JSON):
+    client -> broker:  {"subscribe": ["<token_id>", ...]}
+    broker -> client:  {"asset_id": "...", "best_bid": 0.41, "best_ask": 0.43, "mid": 0.42}
+
+The broker exits on its own after IDLE_TIMEOUT seconds without subscribers.
+
+The socket lives in a per-user 0700 directory ($XDG_RUNTIME_DIR/polymarket-trader,
+or ~/.polymarket-trader) and clients refuse sockets owned by another user,
+since quotes from it drive real orders. Broker stderr goes to wsbroker.log
+next to the socket.
+
+Usage:
+    # Normally started automatically by general_trader.py
+    python scripts/wsbroker.py
+"""
+
+import os
+import sys
+import stat
+import time
+import asyncio
+import logging
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.http import json_dumps, json_loads
+from src.websocket_client import MarketWebSocket, OrderbookSnapshot, calc_mid_price
+
+logger = logging.getLogger("wsbroker")
+
+
+def _default_socket_dir() -> Path:
+    """Per-user runtime directory for the broker socket."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "polymarket-trader"
+    return Path.home() / ".polymarket-trader"
+
+
+BROKER_SOCKET = os.environ.get("POLY_BROKER_SOCKET", str(_default_socket_dir() / "wsbroker.sock"))
+IDLE_TIMEOUT = 60.0  # seconds without subscribers before shutting down
+MAX_CLIENT_BUFFER = 256 * 1024  # bytes queued for one client before it is dropped
+
+
+def _ensure_private_dir(path: str) -> bool:
+    """
+    Create the socket's directory as 0700 and check nobody else can write it.
+
+    Returns:
+        True if the directory is owned by this user and closed to others
+    """
+    directory = Path(path).parent
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = directory.stat()
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        logger.warning(f"Refusing broker socket in {directory}: must be owned by you with mode 0700")
+        return False
+    return True
+
+
+def _socket_is_trusted(path: str) -> bool:
+    """True if path is a unix socket owned by the current user."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+@contextmanager
+def _socket_lock(path: str):
+    """Hold an exclusive lock on <path>.lock so brokers bind and unlink one at a time."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # releases the lock
+
+
+def encode_quote(asset_id: str, best_bid: float, best_ask: float) -> bytes:
+    """Encode a top-of-book quote as one protocol line."""
+    return json_dumps({
+        "asset_id": asset_id,
+        "best_bid": best_bid,
+        "best_ask": best_ask,
+        "mid": calc_mid_price(best_bid, best_ask),
+    }) + b"\n"
+
+
+class Broker:
+    """Fans out quotes from a single MarketWebSocket to unix-socket clients."""
+
+    def __init__(self, path: str = BROKER_SOCKET, idle_timeout: float = IDLE_TIMEOUT):
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.ws = MarketWebSocket()
+        self.subscribers: Dict[str, Set[asyncio.StreamWriter]] = {}
+        self._last_active = time.monotonic()
+        self._socket_inode: Optional[int] = None
+
+        self.ws.on_book(self._on_book)
+        self.ws.on_price_change(self._on_price_change)
+
+    def _publish(self, asset_id: str, best_bid: float, best_ask: float) -> None:
+        writers = self.subscribers.get(asset_id)
+        if not writers:
+            return
+        line = encode_quote(asset_id, best_bid, best_ask)
+        for writer in list(writers):
+            if writer.is_closing():
+                writers.discard(writer)
+            elif writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                # A slow or suspended client; drop it rather than buffer
+                # quotes for it without bound (it reconnects when it resumes)
+                logger.warning("Dropping subscriber with a full write buffer")
+                writers.discard(writer)
+                writer.transport.abort()
+            else:
+                writer.write(line)
+
+    def _on_book(self, snapshot: OrderbookSnapshot) -> None:
+        self._publish(snapshot.asset_id, snapshot.best_bid, snapshot.best_ask)
+
+    def _on_price_change(self, market: str, changes: List) -> None:
+        for change in changes:
+            self._publish(change.asset_id, change.best_bid, change.best_ask)
+
+    async def _add_subscriber(self, writer: asyncio.StreamWriter, token_ids: List[str]) -> None:
+        new_tokens = [t for t in token_ids if t not in self.subscribers]
+        for token_id in token_ids:
+            self.subscribers.setdefault(token_id, set()).add(writer)
+            # Replay the cached book so the client doesn't wait for the next update
+            book = self.ws.get_orderbook(token_id)
+            if book:
+                writer.write(encode_quote(token_id, book.best_bid, book.best_ask))
+        if new_tokens:
+            await self.ws.subscribe_more(new_tokens)
+
+    async def _remove_subscriber(self, writer: asyncio.StreamWriter, token_ids: List[str]) -> None:
+        unused = []
+        for token_id in token_ids:
+            writers = self.subscribers.get(token_id)
+            if writers is None:
+                continue
+            writers.discard(writer)
+            if not writers:
+                del self.subscribers[token_id]
+                unused.append(token_id)
+        if unused:
+            await self.ws.unsubscribe(unused)
+        self._last_active = time.monotonic()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one subscriber until it disconnects."""
+        token_ids: List[str] = []
+        try:
+            request = json_loads(await reader.readline())
+            token_ids = [str(t) for t in request.get("subscribe", [])]
+            await self._add_subscriber(writer, token_ids)
+            # Clients don't send anything else; EOF means they went away
+            await reader.read()
+        except (ValueError, AttributeError, ConnectionError) as e:
+            logger.debug(f"Client error: {e}")
+        finally:
+            await self._remove_subscriber(writer, token_ids)
+            writer.close()
+
+    async def _wait_until_idle(self) -> None:
+        while True:
+            await asyncio.sleep(min(5.0, self.idle_timeout))
+            idle_for = time.monotonic() - self._last_active
+            if not self.subscribers and idle_for >= self.idle_timeout:
+                return
+
+    async def _is_live(self) -> bool:
+        """True if a broker of ours is already accepting on self.path."""
+        if not _socket_is_trusted(self.path):
+            return False
+        try:
+            _, writer = await asyncio.open_unix_connection(self.path)
+        except OSError:
+            return False
+        writer.close()
+        return True
+
+    async def serve(self) -> None:
+        """Run the broker until it has been idle for idle_timeout seconds."""
+        if not _ensure_private_dir(self.path):
+            return
+
+        with _socket_lock(self.path):
+            if await self._is_live():
+                logger.info(f"Broker already running at {self.path}")
+                return
+            if os.path.lexists(self.path):
+                os.unlink(self.path)  # stale socket from a crashed broker
+            server = await asyncio.start_unix_server(self.handle_client, path=self.path)
+            os.chmod(self.path, 0o600)
+            self._socket_inode = os.stat(self.path).st_ino
+
+        ws_task = asyncio.create_task(self.ws.run(auto_reconnect=True))
+        logger.info(f"Broker listening on {self.path}")
+
+        try:
+            await self._wait_until_idle()
+        finally:
+            server.close()
+            self.ws.stop()
+            ws_task.cancel()
+            await self.ws.disconnect()
+            with _socket_lock(self.path):
+                self._unlink_own_socket()
+            logger.info("Broker stopped")
+
+    def _unlink_own_socket(self) -> None:
+        """Remove self.path only if it is still the socket this broker bound."""
+        try:
+            if os.stat(self.path).st_ino == self._socket_inode:
+                os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _spawn_broker(path: str) -> None:
+    """Start a detached broker process, logging its stderr next to the socket."""
+    env = dict(os.environ, POLY_BROKER_SOCKET=path)
+    log_fd = os.open(str(Path(path).with_name("wsbroker.log")), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve())],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=log_fd,
+            env=env,
+            start_new_session=True,
+        )
+    finally:
+        os.close(log_fd)
+
+
+async def connect_to_broker(token_ids: List[str], path: str = BROKER_SOCKET, spawn: bool = True):
+    """
+    Subscribe to quotes through the local broker, starting it if needed.
+
+    Args:
+        token_ids: Token IDs to receive quotes for
+        path: Broker socket path
+        spawn: Start a broker process if none is listening
+
+    Returns:
+        (reader, writer) stream pair, or None if the broker is unavailable
+        (e.g. on platforms without unix sockets)
+    """
+    if not hasattr(asyncio, "open_unix_connection"):
+        return None
+    if not _ensure_private_dir(path):
+        return None
+
+    for attempt in range(30):
+        if os.path.lexists(path) and not _socket_is_trusted(path):
+            logger.warning(f"Ignoring broker socket {path}: not a socket owned by you")
+            return None
+        try:
+            reader, writer = await asyncio.open_unix_connection(path)
+            break
+        except OSError:
+            if attempt == 0 and spawn:
+                _spawn_broker(path)
+            elif not spawn:
+                return None
+            await asyncio.sleep(0.1)
+    else:
+        return None
+
+    writer.write(json_dumps({"subscribe": token_ids}) + b"\n")
+    await writer.drain()
+    return reader, writer
+
+
+async def stream_quotes(feed, token_ids: List[str], on_quote, path: str = BROKER_SOCKET) -> None:
+    """
+    Deliver broker quotes to on_quote(asset_id, mid) until cancelled.
+
+    Reconnects (restarting the broker if needed) when the connection drops.
+    """
+    while True:
+        if feed is None:
+            await asyncio.sleep(1.0)
+            try:
+                feed = await connect_to_broker(token_ids, path)
+            except Exception as e:
+                logger.warning(f"Broker connect error: {e!r}")
+            continue
+
+        reader, writer = feed
+        try:
+            async for line in reader:
+                quote = json_loads(line)
+                on_quote(quote["asset_id"], quote["mid"])
+        except Exception as e:
+            # Any bad quote or socket error reconnects instead of silently
+            # ending the (un-awaited) feed task
+            logger.warning(f"Broker feed error: {e!r}")
+        finally:
+            writer.close()
+        feed = None
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(Broker().serve())
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        pass
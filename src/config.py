@@ -31,18 +31,44 @@ Example:
     config = Config.load("config.yaml")
 """
 
+import copy
 import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from dataclasses import asdict
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader  # libyaml C parser
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 # Environment variable prefix
 ENV_PREFIX = "POLY_"
 
 
+# Parsed YAML keyed by (path, mtime_ns, size); edited files miss the cache
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_YAML_CACHE_MAXSIZE = 100
+
+
+def _load_yaml(path: Path) -> Dict[str, Any]:
+    """Parse a YAML file, reusing the previous parse if the file is unchanged."""
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+    data = _YAML_CACHE.get(key)
+    if data is None:
+        with open(path, 'r') as f:
+            data = yaml.load(f, Loader=YamlLoader) or {}
+        if len(_YAML_CACHE) >= _YAML_CACHE_MAXSIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            _YAML_CACHE.pop(next(iter(_YAML_CACHE)), None)
+        _YAML_CACHE[key] = data
+    return copy.deepcopy(data)
+
+
 def get_env(name: str, default: str = "") -> str:
     """Get environment variable with prefix."""
     return os.environ.get(f"{ENV_PREFIX}{name}", default)
@@ -188,10 +214,7 @@ class Config:
         if not path.exists():
             raise ConfigNotFoundError(f"Config file not found: {filepath}")
 
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f) or {}
-
-        return cls.from_dict(data)
+        return cls.from_dict(_load_yaml(path))
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Config":
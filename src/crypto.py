@@ -60,9 +60,16 @@ class KeyManager:
     # Salt size in bytes
     SALT_SIZE = 16
 
-    def __init__(self):
-        """Initialize KeyManager with a random salt."""
+    def __init__(self, iterations: int = PBKDF2_ITERATIONS):
+        """
+        Initialize KeyManager with a random salt.
+
+        Args:
+            iterations: PBKDF2 iteration count (lower it only in tests;
+                decrypting requires the count used to encrypt)
+        """
         self.salt = secrets.token_bytes(self.SALT_SIZE)
+        self.iterations = iterations
 
     def _derive_key(self, password: str) -> bytes:
         """
@@ -78,7 +85,7 @@ class KeyManager:
             algorithm=hashes.SHA256(),
             length=32,
             salt=self.salt,
-            iterations=self.PBKDF2_ITERATIONS,
+            iterations=self.iterations,
             backend=default_backend()
         )
         return base64.urlsafe_b64encode(kdf.derive(password.encode()))
@@ -241,9 +248,11 @@ def verify_private_key(private_key: str) -> Tuple[bool, str]:
     if len(key) != 64:
         return False, "Key must be 64 hex characters"
 
-    # Check valid hex
+    # Check valid hex; fromhex skips whitespace between byte pairs, so a
+    # short result means the 64 chars were not all hex digits
     try:
-        int(key, 16)
+        if len(bytes.fromhex(key)) != 32:
+            return False, "Key contains invalid characters"
     except ValueError:
         return False, "Key contains invalid characters"
 
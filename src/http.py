@@ -1,24 +1,71 @@
 """
 HTTP Utilities - Shared HTTP session helpers.
 
-Provides a thread-local requests.Session mixin to avoid cross-thread reuse.
+Provides a thread-local requests.Session mixin to avoid cross-thread reuse,
+plus JSON helpers that use orjson when it is installed.
 """
 
+import json
 import threading
-from typing import Any
+from typing import Any, List, Union
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode JSON to compact UTF-8 bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def json_line(record: Any) -> bytes:
+    """
+    Encode a record as one JSONL line, using orjson when available.
+
+    With orjson, NaN and +/-inf are written as null (the stdlib would emit
+    non-standard NaN/Infinity tokens that strict readers reject). Integers
+    beyond 64 bits, which orjson cannot encode, fall back to the stdlib
+    encoder so the record is still logged.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return (json.dumps(record) + "\n").encode()
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a response body without going through requests' json()."""
+    return json_loads(response.content)
+
 
 class ThreadLocalSessionMixin:
     """
     Mixin providing a thread-local requests.Session.
 
     Each thread gets its own Session instance to keep connections isolated.
+    Every session created is also tracked so close_sessions() can release
+    the pools held by worker threads, not just the calling thread's.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._session_local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
         super().__init__(*args, **kwargs)
 
     def _get_session(self) -> requests.Session:
@@ -26,9 +73,23 @@ class ThreadLocalSessionMixin:
         session = getattr(self._session_local, "session", None)
         if session is None:
             session = requests.Session()
+            self._configure_session(session)
             self._session_local.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
         return session
 
+    def close_sessions(self) -> None:
+        """Close every session this instance created, in any thread."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._session_local.session = None
+
+    def _configure_session(self, session: requests.Session) -> None:
+        """Hook for subclasses to mount adapters or set default headers."""
+
     @property
     def session(self) -> requests.Session:
         """Expose the thread-local session for internal use."""
@@ -19,9 +19,49 @@ Example:
     market = search.get_market("0x123...")
 """
 
-import json
-from typing import Optional, Dict, Any, List
-from .http import ThreadLocalSessionMixin
+import asyncio
+import copy
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .http import ThreadLocalSessionMixin, json_dumps, json_loads, response_json
+
+
+# Gamma's encoding of the standard binary market outcomes
+BINARY_OUTCOMES = '["Yes", "No"]'
+BINARY_LABELS = ("yes", "no")
+
+
+def _to_float(value: Any) -> float:
+    """Convert an API number (often a string) to float, defaulting to 0.0."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+@lru_cache(maxsize=4096)
+def _cached_json_list(raw: str) -> Optional[Tuple[Any, ...]]:
+    """Decode a JSON-encoded list field, memoized since markets recur across searches."""
+    try:
+        value = json_loads(raw)
+    except ValueError:
+        return None
+    # Tuples so cached results can't be mutated by callers
+    return tuple(value) if isinstance(value, list) else None
+
+
+def _decode_json_list(raw: str, default: List[Any]) -> List[Any]:
+    """Decode a Gamma stringified list (e.g. clobTokenIds), or return default."""
+    value = _cached_json_list(raw)
+    return list(value) if value is not None else default
 
 
 class MarketSearch(ThreadLocalSessionMixin):
@@ -30,16 +70,97 @@ class MarketSearch(ThreadLocalSessionMixin):
 
     Uses the Gamma API to search markets by keyword, category,
     or status. Returns token IDs and metadata ready for trading.
+
+    Market and event lookups are cached in-process for ``cache_ttl``
+    seconds so repeated searches don't repeat the Gamma round-trip.
+    Orderbooks and prices are never cached.
     """
 
     GAMMA_HOST = "https://gamma-api.polymarket.com"
     CLOB_HOST = "https://clob.polymarket.com"
+    CACHE_MAXSIZE = 256
+
+    # Connection pool / retry settings for the persistent session
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+    MAX_RETRIES = 2
 
-    def __init__(self, gamma_host: str = GAMMA_HOST, clob_host: str = CLOB_HOST, timeout: int = 15):
+    # Worker threads for the async wrappers. Sessions are thread-local, so a
+    # small fixed pool keeps a few warm keep-alive connections instead of
+    # one cold session per default-executor thread.
+    ASYNC_WORKERS = 4
+
+    def __init__(
+        self,
+        gamma_host: str = GAMMA_HOST,
+        clob_host: str = CLOB_HOST,
+        timeout: int = 15,
+        cache_ttl: float = 60.0,
+    ):
         super().__init__()
         self.gamma_host = gamma_host.rstrip("/")
         self.clob_host = clob_host.rstrip("/")
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        # Shared by the worker pool and to_thread callers, so guard it
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _configure_session(self, session: requests.Session) -> None:
+        """Keep connections alive, retry transient errors and ask for JSON."""
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            # POST /books is a read-only query, so it is safe to retry
+            allowed_methods=frozenset({"GET", "POST"}),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept"] = "application/json"
+
+    def _cache_get(self, key: Tuple[Any, ...]) -> Any:
+        """Return a copy of a cached result, or None if missing/expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                self._cache.pop(key, None)
+                return None
+        # Stored values are never mutated, so copying outside the lock is safe
+        return copy.deepcopy(value)
+
+    def _cache_set(self, key: Tuple[Any, ...], value: Any) -> None:
+        """Store a copy of a result so callers can't mutate the cache."""
+        if self.cache_ttl <= 0 or not value:
+            return
+        entry = (time.monotonic() + self.cache_ttl, copy.deepcopy(value))
+        with self._cache_lock:
+            if len(self._cache) >= self.CACHE_MAXSIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                self._cache.pop(next(iter(self._cache)), None)
+            self._cache[key] = entry
+
+    def clear_cache(self) -> None:
+        """Drop all cached market/event lookups."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Shut down the async worker pool and close every pooled session."""
+        if self._executor is not None:
+            # Wait so no worker is mid-request when its session is closed
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.close_sessions()
 
     def find_markets(
         self,
@@ -60,6 +181,11 @@ class MarketSearch(ThreadLocalSessionMixin):
         Returns:
             List of market dictionaries with parsed token IDs
         """
+        cache_key = ("find_markets", query, active_only, limit, offset)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         url = f"{self.gamma_host}/markets"
         params = {
             "limit": limit,
@@ -77,7 +203,7 @@ class MarketSearch(ThreadLocalSessionMixin):
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            markets = response.json()
+            markets = response_json(response)
         except Exception as e:
             print(f"Search failed: {e}")
             return []
@@ -88,6 +214,7 @@ class MarketSearch(ThreadLocalSessionMixin):
             if parsed:
                 results.append(parsed)
 
+        self._cache_set(cache_key, results)
         return results
 
     def find_markets_by_tag(self, tag: str, limit: int = 20) -> List[Dict[str, Any]]:
@@ -112,11 +239,11 @@ class MarketSearch(ThreadLocalSessionMixin):
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            markets = response.json()
+            markets = response_json(response)
         except Exception:
             return []
 
-        return [self._parse_market(m) for m in markets if self._parse_market(m)]
+        return [parsed for m in markets if (parsed := self._parse_market(m))]
 
     def get_market_by_id(self, condition_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -128,12 +255,19 @@ class MarketSearch(ThreadLocalSessionMixin):
         Returns:
             Parsed market dict or None
         """
+        cache_key = ("market_by_id", condition_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         url = f"{self.gamma_host}/markets/{condition_id}"
 
         try:
             response = self.session.get(url, timeout=self.timeout)
             if response.status_code == 200:
-                return self._parse_market(response.json())
+                market = self._parse_market(response_json(response))
+                self._cache_set(cache_key, market)
+                return market
         except Exception:
             pass
         return None
@@ -148,12 +282,19 @@ class MarketSearch(ThreadLocalSessionMixin):
         Returns:
             Parsed market dict or None
         """
+        cache_key = ("market_by_slug", slug)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         url = f"{self.gamma_host}/markets/slug/{slug}"
 
         try:
             response = self.session.get(url, timeout=self.timeout)
             if response.status_code == 200:
-                return self._parse_market(response.json())
+                market = self._parse_market(response_json(response))
+                self._cache_set(cache_key, market)
+                return market
         except Exception:
             pass
         return None
@@ -173,6 +314,11 @@ class MarketSearch(ThreadLocalSessionMixin):
         Returns:
             List of event dictionaries with nested markets
         """
+        cache_key = ("events", query, limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         url = f"{self.gamma_host}/events"
         params = {
             "limit": limit,
@@ -185,7 +331,7 @@ class MarketSearch(ThreadLocalSessionMixin):
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            events = response.json()
+            events = response_json(response)
         except Exception:
             return []
 
@@ -198,8 +344,8 @@ class MarketSearch(ThreadLocalSessionMixin):
                 "description": event.get("description", ""),
                 "start_date": event.get("startDate", ""),
                 "end_date": event.get("endDate", ""),
-                "liquidity": float(event.get("liquidity", 0) or 0),
-                "volume": float(event.get("volume", 0) or 0),
+                "liquidity": _to_float(event.get("liquidity")),
+                "volume": _to_float(event.get("volume")),
                 "markets": [],
             }
 
@@ -212,6 +358,7 @@ class MarketSearch(ThreadLocalSessionMixin):
             if parsed_event["markets"]:
                 results.append(parsed_event)
 
+        self._cache_set(cache_key, results)
         return results
 
     def get_orderbook(self, token_id: str) -> Dict[str, Any]:
@@ -230,11 +377,49 @@ class MarketSearch(ThreadLocalSessionMixin):
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            return response_json(response)
         except Exception as e:
             print(f"Failed to get orderbook: {e}")
             return {}
 
+    def get_orderbooks(self, token_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get orderbooks for several tokens in a single request.
+
+        Uses the CLOB POST /books endpoint, which accepts up to 500
+        token IDs per call.
+
+        Args:
+            token_ids: List of CLOB token IDs
+
+        Returns:
+            Dictionary mapping token_id to orderbook data
+        """
+        if not token_ids:
+            return {}
+
+        url = f"{self.clob_host}/books"
+        body = [{"token_id": tid} for tid in token_ids]
+
+        try:
+            response = self.session.post(
+                url,
+                data=json_dumps(body),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            books = response_json(response)
+        except Exception as e:
+            print(f"Failed to get orderbooks: {e}")
+            return {}
+
+        # An error object or other non-list body means no books, like the
+        # other lookups' empty result on a bad response
+        if not isinstance(books, list):
+            return {}
+        return {book["asset_id"]: book for book in books if isinstance(book, dict) and "asset_id" in book}
+
     def get_market_price(self, token_id: str) -> Optional[float]:
         """
         Get the current mid price for a token.
@@ -245,7 +430,59 @@ class MarketSearch(ThreadLocalSessionMixin):
         Returns:
             Mid price as float, or None
         """
-        book = self.get_orderbook(token_id)
+        return self._mid_from_book(self.get_orderbook(token_id))
+
+    def get_market_prices(self, token_ids: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get mid prices for several tokens in a single request.
+
+        Uses the CLOB POST /midpoints endpoint. Tokens it doesn't price
+        (e.g. one-sided books) or a failed request fall back to one
+        batched /books call.
+
+        Args:
+            token_ids: List of CLOB token IDs
+
+        Returns:
+            Dictionary mapping token_id to mid price (or None)
+        """
+        if not token_ids:
+            return {}
+
+        url = f"{self.clob_host}/midpoints"
+        body = [{"token_id": tid} for tid in token_ids]
+        prices: Dict[str, Optional[float]] = {}
+
+        try:
+            response = self.session.post(
+                url,
+                data=json_dumps(body),
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            midpoints = response_json(response).items()
+        except Exception:
+            midpoints = ()
+
+        # A bad value only sends its own token to the /books fallback
+        for tid, mid in midpoints:
+            try:
+                prices[str(tid)] = float(mid)
+            except (TypeError, ValueError):
+                continue
+
+        missing = [tid for tid in token_ids if tid not in prices]
+        if missing:
+            books = self.get_orderbooks(missing)
+            for tid in missing:
+                prices[tid] = self._mid_from_book(books.get(tid))
+
+        return {tid: prices[tid] for tid in token_ids}
+
+    @staticmethod
+    def _mid_from_book(book: Optional[Dict[str, Any]]) -> Optional[float]:
+        """Mid price from a raw CLOB orderbook, falling back to one side."""
         if not book:
             return None
 
@@ -263,6 +500,46 @@ class MarketSearch(ThreadLocalSessionMixin):
             return best_ask
         return None
 
+    async def _run_in_worker(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking lookup on this instance's worker pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.ASYNC_WORKERS,
+                thread_name_prefix="market-search",
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def find_markets_async(
+        self,
+        query: str,
+        active_only: bool = True,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Async wrapper for find_markets that doesn't block the event loop."""
+        return await self._run_in_worker(self.find_markets, query, active_only, limit, offset)
+
+    async def get_trending_async(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Async wrapper for get_trending that doesn't block the event loop."""
+        return await self._run_in_worker(self.get_trending, limit)
+
+    async def get_orderbook_async(self, token_id: str) -> Dict[str, Any]:
+        """Async wrapper for get_orderbook that doesn't block the event loop."""
+        return await self._run_in_worker(self.get_orderbook, token_id)
+
+    async def get_orderbooks_async(self, token_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Async wrapper for get_orderbooks that doesn't block the event loop."""
+        return await self._run_in_worker(self.get_orderbooks, token_ids)
+
+    async def get_market_price_async(self, token_id: str) -> Optional[float]:
+        """Async wrapper for get_market_price that doesn't block the event loop."""
+        return await self._run_in_worker(self.get_market_price, token_id)
+
+    async def get_market_prices_async(self, token_ids: List[str]) -> Dict[str, Optional[float]]:
+        """Async wrapper for get_market_prices that doesn't block the event loop."""
+        return await self._run_in_worker(self.get_market_prices, token_ids)
+
     def get_trending(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Get trending/popular markets.
@@ -270,6 +547,11 @@ class MarketSearch(ThreadLocalSessionMixin):
         Returns:
             List of markets sorted by volume
         """
+        cache_key = ("trending", limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         url = f"{self.gamma_host}/markets"
         params = {
             "active": "true",
@@ -282,11 +564,13 @@ class MarketSearch(ThreadLocalSessionMixin):
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
-            markets = response.json()
+            markets = response_json(response)
         except Exception:
             return []
 
-        return [self._parse_market(m) for m in markets if self._parse_market(m)]
+        results = [parsed for m in markets if (parsed := self._parse_market(m))]
+        self._cache_set(cache_key, results)
+        return results
 
     def _parse_market(self, market: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Parse raw Gamma API market into clean format with token IDs."""
@@ -296,41 +580,29 @@ class MarketSearch(ThreadLocalSessionMixin):
         # Parse token IDs
         clob_token_ids = market.get("clobTokenIds", "[]")
         if isinstance(clob_token_ids, str):
-            try:
-                token_ids = json.loads(clob_token_ids)
-            except json.JSONDecodeError:
-                token_ids = []
+            token_ids = _decode_json_list(clob_token_ids, [])
         else:
             token_ids = clob_token_ids or []
 
-        # Parse outcomes
-        outcomes = market.get("outcomes", '["Yes", "No"]')
-        if isinstance(outcomes, str):
-            try:
-                outcomes = json.loads(outcomes)
-            except json.JSONDecodeError:
-                outcomes = ["Yes", "No"]
+        # Parse outcomes; most markets are plain Yes/No, so skip decoding
+        # and lower-casing for that exact string
+        outcomes = market.get("outcomes", BINARY_OUTCOMES)
+        if outcomes == BINARY_OUTCOMES:
+            outcomes = ["Yes", "No"]
+            labels = BINARY_LABELS
+        else:
+            if isinstance(outcomes, str):
+                outcomes = _decode_json_list(outcomes, ["Yes", "No"])
+            labels = [str(outcome).lower() for outcome in outcomes]
 
         # Parse outcome prices
         outcome_prices = market.get("outcomePrices", '["0.5", "0.5"]')
         if isinstance(outcome_prices, str):
-            try:
-                outcome_prices = json.loads(outcome_prices)
-            except json.JSONDecodeError:
-                outcome_prices = []
+            outcome_prices = _decode_json_list(outcome_prices, [])
 
         # Build token map: {outcome_label: token_id}
-        token_map = {}
-        price_map = {}
-        for i, outcome in enumerate(outcomes):
-            label = str(outcome).lower()
-            if i < len(token_ids):
-                token_map[label] = token_ids[i]
-            if i < len(outcome_prices):
-                try:
-                    price_map[label] = float(outcome_prices[i])
-                except (ValueError, TypeError):
-                    price_map[label] = 0.0
+        token_map = dict(zip(labels, token_ids))
+        price_map = {label: _to_float(price) for label, price in zip(labels, outcome_prices)}
 
         return {
             "condition_id": market.get("conditionId", ""),
@@ -343,9 +615,9 @@ class MarketSearch(ThreadLocalSessionMixin):
             "prices": price_map,
             "end_date": market.get("endDate", ""),
             "accepting_orders": market.get("acceptingOrders", False),
-            "liquidity": float(market.get("liquidity", 0) or 0),
-            "volume": float(market.get("volume", 0) or 0),
-            "volume_24h": float(market.get("volume24hr", 0) or 0),
+            "liquidity": _to_float(market.get("liquidity")),
+            "volume": _to_float(market.get("volume")),
+            "volume_24h": _to_float(market.get("volume24hr")),
             "best_bid": market.get("bestBid"),
             "best_ask": market.get("bestAsk"),
             "spread": market.get("spread"),
@@ -22,16 +22,34 @@ Example:
 """
 
 import time
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from dataclasses import dataclass
+from eth_abi import encode as abi_encode
 from eth_account import Account
-from eth_account.messages import encode_typed_data
-from eth_utils import to_checksum_address
+from eth_account.messages import SignableMessage
+from eth_utils import keccak, to_checksum_address
 
 
 # USDC has 6 decimal places
 USDC_DECIMALS = 6
 
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def _timestamp_nonce() -> int:
+    """Default order nonce: the current Unix time in seconds."""
+    return int(time.time())
+
+
+# Source of default order nonces; swap it to make nonces deterministic
+_nonce_source: Callable[[], int] = _timestamp_nonce
+
+
+def _type_hash(primary_type: str, fields: list) -> bytes:
+    """keccak256 of the EIP-712 encodeType string for a struct without references."""
+    members = ",".join(f"{f['type']} {f['name']}" for f in fields)
+    return keccak(text=f"{primary_type}({members})")
+
 
 @dataclass
 class Order:
@@ -70,7 +88,7 @@ class Order:
             raise ValueError(f"Invalid size: {self.size}")
 
         if self.nonce is None:
-            self.nonce = int(time.time())
+            self.nonce = _nonce_source()
 
         # Convert to integers for blockchain
         self.maker_amount = str(int(self.size * self.price * 10**USDC_DECIMALS))
@@ -122,6 +140,39 @@ class OrderSigner:
         ]
     }
 
+    # EIP-712 struct hashing is fixed for the domain and Order type, so the
+    # type hash and field ABI types are computed once rather than per order
+    ORDER_TYPE_HASH = _type_hash("Order", ORDER_TYPES["Order"])
+    ORDER_ABI_TYPES = ["bytes32"] + [f["type"] for f in ORDER_TYPES["Order"]]
+    DOMAIN_SEPARATOR = keccak(abi_encode(
+        ["bytes32", "bytes32", "bytes32", "uint256"],
+        [
+            _type_hash("EIP712Domain", [
+                {"name": "name", "type": "string"},
+                {"name": "version", "type": "string"},
+                {"name": "chainId", "type": "uint256"},
+            ]),
+            keccak(text=DOMAIN["name"]),
+            keccak(text=DOMAIN["version"]),
+            DOMAIN["chainId"],
+        ],
+    ))
+
+    # L1 authentication message type, sharing the domain above
+    AUTH_TYPES = {
+        "ClobAuth": [
+            {"name": "address", "type": "address"},
+            {"name": "timestamp", "type": "string"},
+            {"name": "nonce", "type": "uint256"},
+            {"name": "message", "type": "string"},
+        ]
+    }
+    AUTH_MESSAGE = "This message attests that I control the given wallet"
+    AUTH_TYPE_HASH = _type_hash("ClobAuth", AUTH_TYPES["ClobAuth"])
+    # EIP-712 encodes string members as their keccak256 hash
+    AUTH_ABI_TYPES = ["bytes32", "address", "bytes32", "uint256", "bytes32"]
+    AUTH_MESSAGE_HASH = keccak(text=AUTH_MESSAGE)
+
     def __init__(self, private_key: str):
         """
         Initialize signer with a private key.
@@ -187,27 +238,19 @@ class OrderSigner:
         if timestamp is None:
             timestamp = str(int(time.time()))
 
-        # Auth message types
-        auth_types = {
-            "ClobAuth": [
-                {"name": "address", "type": "address"},
-                {"name": "timestamp", "type": "string"},
-                {"name": "nonce", "type": "uint256"},
-                {"name": "message", "type": "string"},
-            ]
-        }
-
-        message_data = {
-            "address": self.address,
-            "timestamp": timestamp,
-            "nonce": nonce,
-            "message": "This message attests that I control the given wallet",
-        }
-
-        signable = encode_typed_data(
-            domain_data=self.DOMAIN,
-            message_types=auth_types,
-            message_data=message_data
+        # hashStruct(ClobAuth), with values in AUTH_TYPES field order
+        struct_hash = keccak(abi_encode(self.AUTH_ABI_TYPES, [
+            self.AUTH_TYPE_HASH,
+            self.address,
+            keccak(text=timestamp),
+            nonce,
+            self.AUTH_MESSAGE_HASH,
+        ]))
+
+        signable = SignableMessage(
+            version=b"\x01",
+            header=self.DOMAIN_SEPARATOR,
+            body=struct_hash,
         )
 
         signed = self.wallet.sign_message(signable)
@@ -227,27 +270,28 @@ class OrderSigner:
             SignerError: If signing fails
         """
         try:
-            # Build order message for EIP-712
-            order_message = {
-                "salt": 0,
-                "maker": to_checksum_address(order.maker),
-                "signer": self.address,
-                "taker": "0x0000000000000000000000000000000000000000",
-                "tokenId": int(order.token_id),
-                "makerAmount": int(order.maker_amount),
-                "takerAmount": int(order.taker_amount),
-                "expiration": 0,
-                "nonce": order.nonce,
-                "feeRateBps": order.fee_rate_bps,
-                "side": order.side_value,
-                "signatureType": order.signature_type,
-            }
-
-            # Sign the order using new API format
-            signable = encode_typed_data(
-                domain_data=self.DOMAIN,
-                message_types=self.ORDER_TYPES,
-                message_data=order_message
+            # hashStruct(order), with values in ORDER_TYPES field order
+            struct_hash = keccak(abi_encode(self.ORDER_ABI_TYPES, [
+                self.ORDER_TYPE_HASH,
+                0,  # salt
+                to_checksum_address(order.maker),
+                self.address,
+                ZERO_ADDRESS,  # taker
+                int(order.token_id),
+                int(order.maker_amount),
+                int(order.taker_amount),
+                0,  # expiration
+                order.nonce,
+                order.fee_rate_bps,
+                order.side_value,
+                order.signature_type,
+            ]))
+
+            # Equivalent to encode_typed_data, reusing the precomputed domain separator
+            signable = SignableMessage(
+                version=b"\x01",
+                header=self.DOMAIN_SEPARATOR,
+                body=struct_hash,
             )
 
             signed = self.wallet.sign_message(signable)
@@ -18,12 +18,13 @@ Example:
     await ws.run()
 """
 
-import json
 import asyncio
 import logging
 from typing import Optional, Dict, Any, List, Callable, Set, Union, Awaitable, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+from .http import json_dumps, json_loads
+
 if TYPE_CHECKING:
     from websockets.client import WebSocketClientProtocol
 
@@ -49,6 +50,17 @@ def _load_websockets():
             return None, Exception
 
 
+def calc_mid_price(best_bid: float, best_ask: float) -> float:
+    """Mid price from top of book, falling back to whichever side is present."""
+    if best_bid > 0 and best_ask < 1:
+        return (best_bid + best_ask) / 2
+    elif best_bid > 0:
+        return best_bid
+    elif best_ask < 1:
+        return best_ask
+    return 0.5
+
+
 @dataclass
 class OrderbookLevel:
     """Single level in the orderbook."""
@@ -79,13 +91,37 @@ class OrderbookSnapshot:
     @property
     def mid_price(self) -> float:
         """Get mid price."""
-        if self.best_bid > 0 and self.best_ask < 1:
-            return (self.best_bid + self.best_ask) / 2
-        elif self.best_bid > 0:
-            return self.best_bid
-        elif self.best_ask < 1:
-            return self.best_ask
-        return 0.5
+        return calc_mid_price(self.best_bid, self.best_ask)
+
+    def apply_change(self, price: float, size: float, side: str) -> None:
+        """
+        Apply a single price level delta in place.
+
+        Levels stay sorted (bids descending, asks ascending), so the level is
+        located by binary search instead of re-sorting the whole side.
+        A size of 0 removes the level.
+        """
+        is_bid = side.upper() == "BUY"
+        levels = self.bids if is_bid else self.asks
+        key = -price if is_bid else price
+
+        lo, hi = 0, len(levels)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            level_key = -levels[mid].price if is_bid else levels[mid].price
+            if level_key < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        exists = lo < len(levels) and levels[lo].price == price
+        if size <= 0:
+            if exists:
+                del levels[lo]
+        elif exists:
+            levels[lo].size = size
+        else:
+            levels.insert(lo, OrderbookLevel(price=price, size=size))
 
     @classmethod
     def from_message(cls, msg: Dict[str, Any]) -> "OrderbookSnapshot":
@@ -359,7 +395,7 @@ class MarketWebSocket:
         }
 
         try:
-            msg_json = json.dumps(subscribe_msg)
+            msg_json = json_dumps(subscribe_msg).decode()
             logger.info(f"Sending subscribe message: {msg_json[:200]}")
             await self._ws.send(msg_json)
             logger.info(f"Subscribed to {len(asset_ids)} assets successfully")
@@ -394,7 +430,7 @@ class MarketWebSocket:
         }
 
         try:
-            await self._ws.send(json.dumps(subscribe_msg))
+            await self._ws.send(json_dumps(subscribe_msg).decode())
             logger.info(f"Subscribed to {len(asset_ids)} additional assets")
             return True
         except Exception as e:
@@ -422,7 +458,7 @@ class MarketWebSocket:
         }
 
         try:
-            await self._ws.send(json.dumps(unsubscribe_msg))
+            await self._ws.send(json_dumps(unsubscribe_msg).decode())
             logger.info(f"Unsubscribed from {len(asset_ids)} assets")
             return True
         except Exception as e:
@@ -446,6 +482,11 @@ class MarketWebSocket:
                 PriceChange.from_dict(pc)
                 for pc in data.get("price_changes", [])
             ]
+            # Keep cached books current so best_bid/best_ask reflect deltas
+            for change in changes:
+                book = self._orderbooks.get(change.asset_id)
+                if book is not None:
+                    book.apply_change(change.price, change.size, change.side)
             await self._run_callback(
                 self._on_price_change,
                 market,
@@ -490,7 +531,11 @@ class MarketWebSocket:
                 if msg_count <= 5 or msg_count % 1000 == 0:
                     logger.info(f"WS message #{msg_count}: {message[:200] if len(message) > 200 else message}")
 
-                data = json.loads(message)
+                try:
+                    data = json_loads(message)
+                except ValueError as e:
+                    logger.error(f"Failed to parse message: {e}")
+                    continue
 
                 # Handle array of messages
                 if isinstance(data, list):
@@ -504,8 +549,6 @@ class MarketWebSocket:
             except self._connection_closed as e:
                 logger.warning(f"WebSocket connection closed: {e}")
                 break
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse message: {e}")
             except Exception as e:
                 logger.error(f"Error processing message: {e}")
                 if self._on_error:
@@ -15,9 +15,10 @@ Usage:
 
 import argparse
 import asyncio
-import time
+import io
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from operator import itemgetter
+from typing import Dict, List, Any, Optional, Set, Tuple
 
 import sys
 import os
@@ -26,10 +27,20 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import uvloop  # optional, POSIX-only faster event loop
+except ImportError:
+    uvloop = None
+
 from src.market_search import MarketSearch
+from src.websocket_client import MarketWebSocket
 from src.bot import TradingBot
 
 
+# Trade directions (BUY/SELL) and momentum directions (UP/DOWN) share glyphs
+DIRECTION_GLYPHS = {'BUY': "📈", 'UP': "📈", 'SELL': "📉", 'DOWN': "📉"}
+
+
 class ValueHunter:
     """
     Scans markets for value opportunities.
@@ -40,10 +51,23 @@ class ValueHunter:
     - Tight spread (can enter/exit without slippage)
     """
     
+    # Seconds to wait for place_order before giving up on the signal
+    ORDER_TIMEOUT = 10.0
+    
     def __init__(self):
         self.search = MarketSearch()
         self.bot = None
         
+        # Momentum watch state (see scan_momentum)
+        self._ws: Optional[MarketWebSocket] = None
+        self._ws_task: Optional[asyncio.Task] = None
+        self._momentum_query: Optional[str] = None
+        self._momentum_market_count = 0
+        self._momentum_prices: Dict[str, float] = {}
+        # token_id -> (question, slug, outcome), and tokens with book events since the last tick
+        self._momentum_tokens: Dict[str, Tuple[str, str, str]] = {}
+        self._momentum_dirty: Set[str] = set()
+        
     def init_bot(self):
         """Initialize trading bot."""
         if not self.bot:
@@ -53,7 +77,7 @@ class ValueHunter:
             )
         return self.bot.is_initialized()
     
-    def scan_opportunities(
+    async def scan_opportunities(
         self,
         min_liquidity: float = 5000,
         max_spread: float = 0.05,
@@ -75,8 +99,12 @@ class ValueHunter:
         opportunities = []
         
         # Get trending markets (high volume = more info)
-        markets = self.search.get_trending(limit=limit)
+        markets = await self.search.get_trending_async(limit=limit)
         
+        # Collect every extreme-priced outcome first so the spread check
+        # needs a single batched orderbook request
+        candidates = []
+        high_threshold = 1 - extreme_threshold
         for market in markets:
             if market['liquidity'] < min_liquidity:
                 continue
@@ -85,56 +113,91 @@ class ValueHunter:
                 continue
             
             # Check each outcome
+            token_ids = market['token_ids']
             for outcome, price in market['prices'].items():
                 # Look for extreme prices
-                if price < extreme_threshold or price > (1 - extreme_threshold):
-                    # Get orderbook for spread check
-                    token_id = market['token_ids'].get(outcome)
-                    if not token_id:
-                        continue
-                    
-                    book = self.search.get_orderbook(token_id)
-                    if not book:
-                        continue
-                    
-                    bids = book.get('bids', [])
-                    asks = book.get('asks', [])
-                    
-                    if not bids or not asks:
-                        continue
-                    
-                    best_bid = float(bids[0]['price'])
-                    best_ask = float(asks[0]['price'])
-                    spread = best_ask - best_bid
-                    
-                    if spread > max_spread:
-                        continue
-                    
-                    # Calculate potential value
-                    is_undervalued = price < extreme_threshold
-                    
-                    opportunities.append({
-                        'question': market['question'],
-                        'slug': market['slug'],
-                        'outcome': outcome,
-                        'price': price,
-                        'best_bid': best_bid,
-                        'best_ask': best_ask,
-                        'spread': spread,
-                        'liquidity': market['liquidity'],
-                        'volume_24h': market['volume_24h'],
-                        'token_id': token_id,
-                        'direction': 'BUY' if is_undervalued else 'SELL',
-                        'rationale': f"{'Low' if is_undervalued else 'High'} price ({price*100:.1f}%) with ${market['liquidity']:,.0f} liquidity",
-                        'end_date': market['end_date'],
-                    })
+                if not extreme_threshold <= price <= high_threshold:
+                    token_id = token_ids.get(outcome)
+                    if token_id:
+                        candidates.append((market, outcome, price, token_id))
+        
+        books = await self.search.get_orderbooks_async([c[3] for c in candidates])
+        
+        for market, outcome, price, token_id in candidates:
+            book = books.get(token_id)
+            if not book:
+                continue
+            
+            bids = book.get('bids', [])
+            asks = book.get('asks', [])
+            
+            if not bids or not asks:
+                continue
+            
+            best_bid = float(bids[0]['price'])
+            best_ask = float(asks[0]['price'])
+            spread = best_ask - best_bid
+            
+            if spread > max_spread:
+                continue
+            
+            # Calculate potential value (the rationale text is built only
+            # when opportunities are printed)
+            opportunities.append({
+                'question': market['question'],
+                'slug': market['slug'],
+                'outcome': outcome,
+                'price': price,
+                'best_bid': best_bid,
+                'best_ask': best_ask,
+                'spread': spread,
+                'liquidity': market['liquidity'],
+                'volume_24h': market['volume_24h'],
+                'token_id': token_id,
+                'direction': 'BUY' if price < extreme_threshold else 'SELL',
+                'end_date': market['end_date'],
+            })
         
         # Sort by liquidity (more liquid = safer)
-        opportunities.sort(key=lambda x: x['liquidity'], reverse=True)
+        opportunities.sort(key=itemgetter('liquidity'), reverse=True)
         
         return opportunities
     
-    def scan_momentum(
+    async def _start_momentum_stream(self, query: str):
+        """Look up the markets for a query once and stream their books."""
+        await self._stop_momentum_stream()
+        markets = await self.search.find_markets_async(query, limit=20)
+        self._momentum_query = query
+        self._momentum_market_count = len(markets)
+        # Keep only the fields the signals need, not the full market dicts.
+        # The baseline is each token's first two-sided book mid, so momentum
+        # always compares book mids and never a Gamma price against a mid
+        self._momentum_tokens = {}
+        self._momentum_prices = {}
+        for market in markets:
+            for outcome, token_id in market['token_ids'].items():
+                self._momentum_tokens[token_id] = (market['question'], market['slug'], outcome)
+        self._momentum_dirty = set()
+        
+        self._ws = ws = MarketWebSocket()
+        dirty = self._momentum_dirty
+        prices = self._momentum_prices
+        
+        @ws.on_book
+        def on_book(snapshot):
+            if snapshot.asset_id not in prices and snapshot.bids and snapshot.asks:
+                prices[snapshot.asset_id] = snapshot.mid_price
+            dirty.add(snapshot.asset_id)
+        
+        @ws.on_price_change
+        def on_price_change(market, changes):
+            dirty.update(change.asset_id for change in changes)
+        
+        # A single MARKET subscription covers every outcome token
+        await ws.subscribe(list(self._momentum_tokens))
+        self._ws_task = asyncio.create_task(ws.run_until_cancelled())
+    
+    async def scan_momentum(
         self,
         query: str,
         check_interval: float = 60,
@@ -143,43 +206,63 @@ class ValueHunter:
         """
         Find markets with recent price momentum.
         
-        Compares current price to recent price and looks for movement.
+        Markets are looked up once per query; after that prices come from a
+        persistent WebSocket subscription, and each call compares the live
+        mid of every token that had a book event against the previous
+        call's snapshot.
         """
-        # First scan
-        markets_t0 = {m['slug']: m for m in self.search.find_markets(query, limit=20)}
+        if self._ws_task is None or query != self._momentum_query:
+            await self._start_momentum_stream(query)
         
-        print(f"Watching {len(markets_t0)} markets for {check_interval}s...")
-        time.sleep(check_interval)
+        print(f"Watching {self._momentum_market_count} markets for {check_interval}s...")
+        await asyncio.sleep(check_interval)
         
-        # Second scan
         momentum_plays = []
-        markets_t1 = {m['slug']: m for m in self.search.find_markets(query, limit=20)}
+        prices = self._momentum_prices
+        changed = [t for t in self._momentum_dirty if t in self._momentum_tokens]
+        self._momentum_dirty.clear()
         
-        for slug, m1 in markets_t1.items():
-            if slug not in markets_t0:
+        for token_id in changed:
+            book = self._ws.get_orderbook(token_id)
+            if not book or not book.bids or not book.asks:
                 continue
+            p0 = prices.get(token_id)
+            p1 = prices[token_id] = book.mid_price
+            if p0 is None:
+                continue  # first two-sided book only sets the baseline
+            change = p1 - p0
             
-            m0 = markets_t0[slug]
-            
-            for outcome in m1['prices']:
-                p0 = m0['prices'].get(outcome, 0.5)
-                p1 = m1['prices'].get(outcome, 0.5)
-                change = p1 - p0
-                
-                if abs(change) >= momentum_threshold:
-                    momentum_plays.append({
-                        'question': m1['question'],
-                        'slug': slug,
-                        'outcome': outcome,
-                        'price_before': p0,
-                        'price_now': p1,
-                        'change': change,
-                        'direction': 'UP' if change > 0 else 'DOWN',
-                        'token_id': m1['token_ids'].get(outcome),
-                    })
+            if abs(change) >= momentum_threshold:
+                question, slug, outcome = self._momentum_tokens[token_id]
+                momentum_plays.append({
+                    'question': question,
+                    'slug': slug,
+                    'outcome': outcome,
+                    'price_before': p0,
+                    'price_now': p1,
+                    'change': change,
+                    'direction': 'UP' if change > 0 else 'DOWN',
+                    'token_id': token_id,
+                })
         
         return momentum_plays
     
+    async def _stop_momentum_stream(self):
+        """Stop the momentum WebSocket stream, if running."""
+        if self._ws_task is not None:
+            self._ws_task.cancel()
+            try:
+                await self._ws_task
+            except asyncio.CancelledError:
+                pass
+            self._ws_task = None
+            self._ws = None
+    
+    async def close(self):
+        """Stop the momentum stream and release pooled HTTP connections."""
+        await self._stop_momentum_stream()
+        self.search.close()
+    
     async def execute_trade(
         self,
         opportunity: Dict[str, Any],
@@ -203,12 +286,20 @@ class ValueHunter:
         if dry_run:
             return True
         
-        result = await self.bot.place_order(
-            token_id=token_id,
-            price=price,
-            size=size / price,  # Convert USD to shares
-            side=side
-        )
+        try:
+            result = await asyncio.wait_for(
+                self.bot.place_order(
+                    token_id=token_id,
+                    price=price,
+                    size=size / price,  # Convert USD to shares
+                    side=side
+                ),
+                timeout=self.ORDER_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            # The request may still reach the exchange; check open orders
+            print(f"  ✗ Order timed out after {self.ORDER_TIMEOUT:.0f}s (status unknown)")
+            return False
         
         if result.success:
             print(f"  ✓ Order placed: {result.order_id}")
@@ -219,22 +310,28 @@ class ValueHunter:
 
 
 def print_opportunities(opps: List[Dict[str, Any]]):
-    """Pretty print opportunities."""
+    """Pretty print opportunities (buffered and written to stdout once)."""
     if not opps:
         print("\nNo opportunities found matching criteria.")
         return
     
-    print(f"\n{'='*80}")
-    print(f"  Found {len(opps)} opportunities")
-    print(f"{'='*80}")
+    buf = io.StringIO()
+    w = buf.write
+    w(f"\n{'='*80}\n")
+    w(f"  Found {len(opps)} opportunities\n")
+    w(f"{'='*80}\n")
     
     for i, opp in enumerate(opps, 1):
-        direction_symbol = "📈" if opp['direction'] == 'BUY' else "📉"
-        print(f"\n{i}. {direction_symbol} {opp['outcome'].upper()} @ {opp['price']*100:.1f}%")
-        print(f"   {opp['question'][:65]}...")
-        print(f"   Bid: {opp['best_bid']:.4f} | Ask: {opp['best_ask']:.4f} | Spread: {opp['spread']*100:.1f}%")
-        print(f"   Liquidity: ${opp['liquidity']:,.0f} | 24h Vol: ${opp['volume_24h']:,.0f}")
-        print(f"   Rationale: {opp['rationale']}")
+        is_buy = opp['direction'] == 'BUY'
+        direction_symbol = DIRECTION_GLYPHS[opp['direction']]
+        w(f"\n{i}. {direction_symbol} {opp['outcome'].upper()} @ {opp['price']*100:.1f}%\n")
+        w(f"   {opp['question'][:65]}...\n")
+        w(f"   Bid: {opp['best_bid']:.4f} | Ask: {opp['best_ask']:.4f} | Spread: {opp['spread']*100:.1f}%\n")
+        w(f"   Liquidity: ${opp['liquidity']:,.0f} | 24h Vol: ${opp['volume_24h']:,.0f}\n")
+        w(f"   Rationale: {'Low' if is_buy else 'High'} price ({opp['price']*100:.1f}%) with ${opp['liquidity']:,.0f} liquidity\n")
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 async def main():
@@ -270,7 +367,7 @@ async def main():
         print(f"  Max spread: {args.max_spread*100:.0f}%")
         print(f"  Extreme threshold: <{args.threshold*100:.0f}% or >{(1-args.threshold)*100:.0f}%")
         
-        opps = hunter.scan_opportunities(
+        opps = await hunter.scan_opportunities(
             min_liquidity=args.min_liquidity,
             max_spread=args.max_spread,
             extreme_threshold=args.threshold,
@@ -281,33 +378,36 @@ async def main():
     elif args.command == 'watch':
         print(f"Watching '{args.query}' for momentum (interval: {args.interval}s)")
         
-        while True:
-            plays = hunter.scan_momentum(args.query, check_interval=args.interval)
-            
-            if plays:
-                print(f"\n⚡ {len(plays)} momentum signals detected!")
-                for p in plays:
-                    direction = "📈" if p['direction'] == 'UP' else "📉"
-                    print(f"  {direction} {p['outcome'].upper()}: {p['price_before']*100:.1f}% → {p['price_now']*100:.1f}% ({p['change']*100:+.1f}%)")
-                    print(f"     {p['question'][:50]}...")
+        try:
+            while True:
+                plays = await hunter.scan_momentum(args.query, check_interval=args.interval)
                 
-                if args.auto:
+                if plays:
+                    print(f"\n⚡ {len(plays)} momentum signals detected!")
                     for p in plays:
-                        # Trade in direction of momentum
-                        opp = {
-                            'question': p['question'],
-                            'outcome': p['outcome'],
-                            'token_id': p['token_id'],
-                            'direction': 'BUY' if p['direction'] == 'UP' else 'SELL',
-                            'best_ask': p['price_now'],
-                            'best_bid': p['price_now'],
-                        }
-                        await hunter.execute_trade(opp, size=args.size, dry_run=False)
-            else:
-                print(f"  No momentum detected. Continuing...")
+                        direction = DIRECTION_GLYPHS[p['direction']]
+                        print(f"  {direction} {p['outcome'].upper()}: {p['price_before']*100:.1f}% → {p['price_now']*100:.1f}% ({p['change']*100:+.1f}%)")
+                        print(f"     {p['question'][:50]}...")
+                    
+                    if args.auto:
+                        for p in plays:
+                            # Trade in direction of momentum
+                            opp = {
+                                'question': p['question'],
+                                'outcome': p['outcome'],
+                                'token_id': p['token_id'],
+                                'direction': 'BUY' if p['direction'] == 'UP' else 'SELL',
+                                'best_ask': p['price_now'],
+                                'best_bid': p['price_now'],
+                            }
+                            await hunter.execute_trade(opp, size=args.size, dry_run=False)
+                else:
+                    print(f"  No momentum detected. Continuing...")
+        finally:
+            await hunter.close()
     
     elif args.command == 'trade':
-        opps = hunter.scan_opportunities()
+        opps = await hunter.scan_opportunities()
         if opps:
             await hunter.execute_trade(opps[0], size=args.size, dry_run=args.dry_run)
         else:
@@ -318,4 +418,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is None:
+        asyncio.run(main())
+    elif hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:  # uvloop < 0.18 has no run()
+        uvloop.install()
+        asyncio.run(main())
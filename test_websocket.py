@@ -3,7 +3,6 @@
 Test WebSocket subscription to Polymarket CLOB market channel.
 """
 
-import json
 import asyncio
 
 try:
@@ -12,11 +11,17 @@ except ImportError:
     print("Please install websockets: pip install websockets")
     exit(1)
 
+try:
+    import uvloop  # optional, POSIX-only faster event loop
+except ImportError:
+    uvloop = None
+
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.gamma_client import GammaClient
+from src.http import json_dumps, json_loads
 
 
 async def test_websocket():
@@ -57,7 +62,7 @@ async def test_websocket():
             "type": "MARKET"
         }
 
-        msg_json = json.dumps(subscribe_msg)
+        msg_json = json_dumps(subscribe_msg).decode()
         print(f"\nSending subscription: {msg_json}")
         await ws.send(msg_json)
         print("Subscription sent!")
@@ -69,7 +74,7 @@ async def test_websocket():
         try:
             async for message in ws:
                 msg_count += 1
-                data = json.loads(message)
+                data = json_loads(message)
                 event_type = data.get("event_type", "unknown")
 
                 if event_type == "book":
@@ -104,6 +109,12 @@ async def test_websocket():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(test_websocket())
+        if uvloop is None:
+            asyncio.run(test_websocket())
+        elif hasattr(uvloop, "run"):
+            uvloop.run(test_websocket())
+        else:  # uvloop < 0.18 has no run()
+            uvloop.install()
+            asyncio.run(test_websocket())
     except KeyboardInterrupt:
         print("\nStopped")
@@ -8,12 +8,6 @@ Run with:
 """
 
 import pytest
-import sys
-from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.bot import TradingBot, OrderResult, NotInitializedError
 from src.config import Config, BuilderConfig, ClobConfig
@@ -64,6 +58,21 @@ class TestTradingBot:
     TEST_PRIVATE_KEY = "0x" + "a" * 64
     TEST_SAFE_ADDRESS = "0x" + "b" * 40
 
+    @pytest.fixture(scope="class")
+    @classmethod
+    def bot_with_signer(cls):
+        """One signing bot per class; construction derives keys and API creds."""
+        return TradingBot(
+            private_key=cls.TEST_PRIVATE_KEY,
+            safe_address=cls.TEST_SAFE_ADDRESS
+        )
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def bot_no_signer(cls):
+        """One bot without a private key per class."""
+        return TradingBot(safe_address=cls.TEST_SAFE_ADDRESS)
+
     def test_init_with_config(self):
         """Test initialization with Config object."""
         config = Config(
@@ -76,55 +85,34 @@ class TestTradingBot:
         assert bot.config == config
         assert bot.signer is None  # No private key provided
 
-    def test_init_with_private_key(self):
+    def test_init_with_private_key(self, bot_with_signer):
         """Test initialization with private key."""
-        bot = TradingBot(
-            private_key=self.TEST_PRIVATE_KEY,
-            safe_address=self.TEST_SAFE_ADDRESS
-        )
-
-        assert bot.signer is not None
+        assert bot_with_signer.signer is not None
         # Signer address is derived from private key, not safe_address
-        assert bot.signer.address.startswith("0x")
-        assert len(bot.signer.address) == 42
+        assert bot_with_signer.signer.address.startswith("0x")
+        assert len(bot_with_signer.signer.address) == 42
 
-    def test_init_with_partial_params(self):
+    def test_init_with_partial_params(self, bot_no_signer):
         """Test initialization with partial parameters."""
         # Should work with just safe_address
-        bot = TradingBot(safe_address=self.TEST_SAFE_ADDRESS)
-
-        assert bot.config.safe_address == self.TEST_SAFE_ADDRESS
+        assert bot_no_signer.config.safe_address == self.TEST_SAFE_ADDRESS
 
-    def test_is_initialized_without_signer(self):
+    def test_is_initialized_without_signer(self, bot_no_signer):
         """Test is_initialized returns False without signer."""
-        bot = TradingBot(safe_address=self.TEST_SAFE_ADDRESS)
+        assert bot_no_signer.is_initialized() is False
 
-        assert bot.is_initialized() is False
-
-    def test_is_initialized_with_signer(self):
+    def test_is_initialized_with_signer(self, bot_with_signer):
         """Test is_initialized returns True with signer."""
-        bot = TradingBot(
-            private_key=self.TEST_PRIVATE_KEY,
-            safe_address=self.TEST_SAFE_ADDRESS
-        )
+        assert bot_with_signer.is_initialized() is True
 
-        assert bot.is_initialized() is True
-
-    def test_require_signer_without_signer(self):
+    def test_require_signer_without_signer(self, bot_no_signer):
         """Test require_signer raises when no signer."""
-        bot = TradingBot(safe_address=self.TEST_SAFE_ADDRESS)
-
         with pytest.raises(NotInitializedError):
-            bot.require_signer()
+            bot_no_signer.require_signer()
 
-    def test_require_signer_with_signer(self):
+    def test_require_signer_with_signer(self, bot_with_signer):
         """Test require_signer returns signer when available."""
-        bot = TradingBot(
-            private_key=self.TEST_PRIVATE_KEY,
-            safe_address=self.TEST_SAFE_ADDRESS
-        )
-
-        signer = bot.require_signer()
+        signer = bot_with_signer.require_signer()
         assert signer is not None
         # Signer address is derived from private key
         assert signer.address.startswith("0x")
@@ -154,41 +142,43 @@ log_level: DEBUG
         assert config.data_dir == "test_credentials"
         assert config.log_level == "DEBUG"
 
-    def test_config_with_builder_credentials(self, tmp_path):
+    def test_config_with_builder_credentials(self):
         """Test config with Builder credentials enables gasless."""
-        config_content = '''
-safe_address: "0x1234567890123456789012345678901234567890"
-builder:
-  api_key: test_key_123
-  api_secret: secret_abc
-  api_passphrase: passphrase_xyz
-'''
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        config = Config.load(str(config_file))
+        config = Config.from_dict({
+            "safe_address": "0x1234567890123456789012345678901234567890",
+            "builder": {
+                "api_key": "test_key_123",
+                "api_secret": "secret_abc",
+                "api_passphrase": "passphrase_xyz",
+            },
+        })
 
         assert config.use_gasless is True
         assert config.builder.is_configured()
 
-    def test_config_without_builder_credentials(self, tmp_path):
+    def test_config_without_builder_credentials(self):
         """Test config without Builder credentials disables gasless."""
-        config_content = '''
-safe_address: "0x1234567890123456789012345678901234567890"
-builder:
-  api_key: ""
-  api_secret: ""
-  api_passphrase: ""
-'''
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(config_content)
-
-        config = Config.load(str(config_file))
+        config = Config.from_dict({
+            "safe_address": "0x1234567890123456789012345678901234567890",
+            "builder": {"api_key": "", "api_secret": "", "api_passphrase": ""},
+        })
 
         assert config.use_gasless is False
         assert config.builder.is_configured() is False
 
-    def test_config_validate_missing_safe_address(self, tmp_path):
+    def test_config_load_reparses_changed_file(self, tmp_path):
+        """Test that cached YAML is reused until the file changes."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("log_level: DEBUG\n")
+
+        first = Config.load(str(config_file))
+        first.log_level = "ERROR"
+        assert Config.load(str(config_file)).log_level == "DEBUG"
+
+        config_file.write_text("log_level: WARNING\n")
+        assert Config.load(str(config_file)).log_level == "WARNING"
+
+    def test_config_validate_missing_safe_address(self):
         """Test config validation fails without safe_address."""
         config = Config()
         errors = config.validate()
@@ -196,21 +186,16 @@ builder:
         assert len(errors) > 0
         assert any("safe_address" in error for error in errors)
 
-    def test_config_validate_valid_config(self, tmp_path):
+    def test_config_validate_valid_config(self):
         """Test config validation passes with valid config."""
         config = Config(safe_address=self.TEST_SAFE_ADDRESS)
         errors = config.validate()
 
         assert len(errors) == 0
 
-    def test_create_order_dict(self):
+    def test_create_order_dict(self, bot_with_signer):
         """Test creating order dictionary."""
-        bot = TradingBot(
-            private_key=self.TEST_PRIVATE_KEY,
-            safe_address=self.TEST_SAFE_ADDRESS
-        )
-
-        order_dict = bot.create_order_dict(
+        order_dict = bot_with_signer.create_order_dict(
             token_id="1234567890",
             price=0.65,
             size=10.0,
@@ -222,14 +207,9 @@ builder:
         assert order_dict["size"] == 10.0
         assert order_dict["side"] == "BUY"
 
-    def test_create_order_dict_side_normalized(self):
+    def test_create_order_dict_side_normalized(self, bot_with_signer):
         """Test that side is normalized to uppercase."""
-        bot = TradingBot(
-            private_key=self.TEST_PRIVATE_KEY,
-            safe_address=self.TEST_SAFE_ADDRESS
-        )
-
-        order_dict = bot.create_order_dict(
+        order_dict = bot_with_signer.create_order_dict(
             token_id="1234567890",
             price=0.65,
             size=10.0,
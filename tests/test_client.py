@@ -3,13 +3,9 @@ Unit tests for client and bot async behavior.
 """
 
 import asyncio
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.client import ClobClient
 from src.bot import TradingBot
 from src.config import Config
@@ -7,14 +7,7 @@ Run with:
     pytest tests/test_crypto.py -v
 """
 
-import os
-import sys
 import pytest
-import tempfile
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.crypto import (
     KeyManager,
@@ -28,11 +21,22 @@ from src.crypto import (
 class TestKeyManager:
     """Tests for KeyManager class."""
 
+    TEST_KEY = "0x" + "a" * 64  # Valid 32-byte key
+    TEST_PASSWORD = "secure_password_123"
+    # The tests check correctness, not KDF strength
+    FAST_ITERATIONS = 1000
+
     def setup_method(self):
         """Set up test fixtures."""
-        self.manager = KeyManager()
-        self.test_key = "0x" + "a" * 64  # Valid 32-byte key
-        self.test_password = "secure_password_123"
+        self.manager = KeyManager(iterations=self.FAST_ITERATIONS)
+        self.test_key = self.TEST_KEY
+        self.test_password = self.TEST_PASSWORD
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def encrypted(cls):
+        """Encrypt the test key once for the tests that only read the blob."""
+        return KeyManager(iterations=cls.FAST_ITERATIONS).encrypt(cls.TEST_KEY, cls.TEST_PASSWORD)
 
     def test_encrypt_decrypt_roundtrip(self):
         """Test that encrypt/decrypt produces original key."""
@@ -49,10 +53,8 @@ class TestKeyManager:
 
         assert decrypted == "0x" + key_without_prefix
 
-    def test_invalid_password_raises(self):
+    def test_invalid_password_raises(self, encrypted):
         """Test that wrong password raises InvalidPasswordError."""
-        encrypted = self.manager.encrypt(self.test_key, self.test_password)
-
         with pytest.raises(InvalidPasswordError):
             self.manager.decrypt(encrypted, "wrong_password")
 
@@ -82,38 +84,35 @@ class TestKeyManager:
         with pytest.raises(ValueError, match="Invalid private key format"):
             self.manager.encrypt("not_hexadecimal", self.test_password)
 
-    def test_encrypted_data_contains_required_fields(self):
+    def test_encrypted_data_contains_required_fields(self, encrypted):
         """Test that encrypted data has all required fields."""
-        encrypted = self.manager.encrypt(self.test_key, self.test_password)
-
         assert "version" in encrypted
         assert "salt" in encrypted
         assert "encrypted" in encrypted
         assert encrypted["version"] == 1
 
-    def test_save_and_load_file(self):
+    def test_save_and_load_file(self, tmp_path):
         """Test saving and loading from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            filepath = os.path.join(tmpdir, "test_key.json")
+        filepath = tmp_path / "test_key.json"
 
-            # Save
-            self.manager.encrypt_and_save(
-                self.test_key,
-                self.test_password,
-                filepath
-            )
+        # Save
+        self.manager.encrypt_and_save(
+            self.test_key,
+            self.test_password,
+            str(filepath)
+        )
 
-            assert os.path.exists(filepath)
+        assert filepath.exists()
 
-            # Verify file permissions are restrictive
-            mode = os.stat(filepath).st_mode & 0o777
-            assert mode == 0o600, "File should have 0o600 permissions"
+        # Verify file permissions are restrictive
+        mode = filepath.stat().st_mode & 0o777
+        assert mode == 0o600, "File should have 0o600 permissions"
 
-            # Load
-            manager2 = KeyManager()
-            decrypted = manager2.load_and_decrypt(self.test_password, filepath)
+        # Load
+        manager2 = KeyManager(iterations=self.FAST_ITERATIONS)
+        decrypted = manager2.load_and_decrypt(self.test_password, str(filepath))
 
-            assert decrypted == self.test_key
+        assert decrypted == self.test_key
 
     def test_file_not_found_raises(self):
         """Test that missing file raises FileNotFoundError."""
@@ -164,6 +163,14 @@ class TestVerifyPrivateKey:
         assert is_valid is False
         assert "invalid characters" in result
 
+    def test_int_literal_separators_rejected(self):
+        """Test that a sign, underscore or space separator is not accepted as hex."""
+        for key in ("+" + "a" * 63, "a" * 31 + "_" + "a" * 32, "aa  " + "a" * 60):
+            is_valid, result = verify_private_key(key)
+
+            assert is_valid is False
+            assert "invalid characters" in result
+
     def test_empty_string(self):
         """Test that empty string fails."""
         is_valid, result = verify_private_key("")
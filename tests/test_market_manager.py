@@ -2,11 +2,6 @@
 Unit tests for MarketManager market switching logic.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from lib.market_manager import MarketManager, MarketInfo
 
 
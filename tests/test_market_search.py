@@ -0,0 +1,253 @@
+"""
+Unit tests for MarketSearch request batching and caching.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+from src.market_search import MarketSearch
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode()
+
+
+class FakeSession:
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(("GET", url, params))
+        return FakeResponse(self.payload)
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        self.calls.append(("POST", url, json.loads(data)))
+        return FakeResponse(self.payload)
+
+
+GAMMA_MARKET = {
+    "conditionId": "0xabc",
+    "question": "Will it rain?",
+    "clobTokenIds": '["1", "2"]',
+    "outcomes": '["Yes", "No"]',
+    "outcomePrices": '["0.4", "0.6"]',
+}
+
+
+def _search_with_session(session, **kwargs) -> MarketSearch:
+    search = MarketSearch(clob_host="https://example.com", **kwargs)
+    search._session_local.session = session
+    return search
+
+
+def test_get_orderbooks_single_post():
+    session = FakeSession([
+        {"asset_id": "1", "bids": [{"price": "0.4", "size": "10"}], "asks": []},
+        {"asset_id": "2", "bids": [], "asks": [{"price": "0.6", "size": "5"}]},
+    ])
+    search = _search_with_session(session)
+
+    books = search.get_orderbooks(["1", "2"])
+
+    assert session.calls == [
+        ("POST", "https://example.com/books", [{"token_id": "1"}, {"token_id": "2"}]),
+    ]
+    assert set(books) == {"1", "2"}
+    assert books["2"]["asks"][0]["price"] == "0.6"
+
+
+def test_get_orderbooks_non_list_body_returns_empty():
+    session = FakeSession({"error": "invalid token id"})
+    search = _search_with_session(session)
+
+    assert search.get_orderbooks(["1"]) == {}
+
+
+def test_get_orderbooks_empty_skips_request():
+    session = FakeSession([])
+    search = _search_with_session(session)
+
+    assert search.get_orderbooks([]) == {}
+    assert session.calls == []
+
+
+def test_find_markets_cached_within_ttl():
+    session = FakeSession([GAMMA_MARKET])
+    search = _search_with_session(session)
+
+    first = search.find_markets("rain", limit=10)
+    first[0]["question"] = "mutated"
+    second = search.find_markets("rain", limit=10)
+
+    assert len(session.calls) == 1
+    assert second[0]["question"] == "Will it rain?"
+
+
+def test_find_markets_cache_keyed_on_args():
+    session = FakeSession([GAMMA_MARKET])
+    search = _search_with_session(session)
+
+    search.find_markets("rain", limit=10)
+    search.find_markets("rain", limit=5)
+
+    assert len(session.calls) == 2
+
+
+def test_find_markets_cache_disabled():
+    session = FakeSession([GAMMA_MARKET])
+    search = _search_with_session(session, cache_ttl=0)
+
+    search.find_markets("rain")
+    search.find_markets("rain")
+
+    assert len(session.calls) == 2
+
+
+def test_cache_concurrent_eviction_stays_bounded():
+    search = MarketSearch()
+    search.CACHE_MAXSIZE = 4
+    errors = []
+
+    def fill(worker):
+        try:
+            for i in range(500):
+                search._cache_set((worker, i), [i])
+                search._cache_get((worker, i - 1))
+        except Exception as e:  # pragma: no cover - only on a race
+            errors.append(e)
+
+    threads = [threading.Thread(target=fill, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(search._cache) <= search.CACHE_MAXSIZE
+
+
+def test_session_mounts_pooled_retrying_adapter():
+    search = MarketSearch()
+    adapter = search.session.get_adapter("https://clob.polymarket.com/book")
+
+    assert adapter._pool_maxsize == MarketSearch.POOL_MAXSIZE
+    assert adapter.max_retries.total == MarketSearch.MAX_RETRIES
+    assert search.session is search.session
+    assert search.session.headers["Accept"] == "application/json"
+
+
+def test_get_market_prices_uses_midpoints_with_book_fallback():
+    class RoutedSession(FakeSession):
+        def post(self, url, data=None, headers=None, timeout=None):
+            self.calls.append(("POST", url, json.loads(data)))
+            if url.endswith("/midpoints"):
+                return FakeResponse({"1": "0.41", "2": None, "3": "n/a"})
+            return FakeResponse([{"asset_id": "2", "bids": [{"price": "0.30"}], "asks": []}])
+
+    session = RoutedSession(None)
+    search = _search_with_session(session)
+
+    prices = search.get_market_prices(["1", "2", "3"])
+
+    assert [call[1] for call in session.calls] == [
+        "https://example.com/midpoints",
+        "https://example.com/books",
+    ]
+    assert session.calls[1][2] == [{"token_id": "2"}, {"token_id": "3"}]
+    assert prices == {"1": pytest.approx(0.41), "2": pytest.approx(0.30), "3": None}
+
+
+def test_async_lookups_reuse_bounded_worker_pool():
+    search = MarketSearch()
+    threads = set()
+
+    def fake_orderbook(token_id):
+        threads.add(threading.get_ident())
+        search.session  # open this worker's thread-local session
+        time.sleep(0.01)
+        return {"bids": [], "asks": []}
+
+    search.get_orderbook = fake_orderbook
+
+    async def fetch_all():
+        await asyncio.gather(*(search.get_orderbook_async(str(i)) for i in range(20)))
+
+    asyncio.run(fetch_all())
+
+    assert 0 < len(threads) <= MarketSearch.ASYNC_WORKERS
+
+    closed = []
+    sessions = list(search._sessions)
+    for session in sessions:
+        session.close = lambda s=session: closed.append(s)
+
+    search.close()
+    assert search._executor is None
+    assert len(sessions) == len(threads)
+    assert closed == sessions
+
+
+def test_market_lookups_async_run_on_worker_pool():
+    search = MarketSearch()
+    seen = []
+
+    def fake_find_markets(query, active_only=True, limit=20, offset=0):
+        seen.append((threading.current_thread().name, query, active_only, limit, offset))
+        return []
+
+    search.find_markets = fake_find_markets
+    search.get_trending = lambda limit=10: seen.append((threading.current_thread().name, limit))
+
+    async def lookup():
+        await search.find_markets_async("rain", limit=5)
+        await search.get_trending_async(limit=3)
+
+    asyncio.run(lookup())
+    search.close()
+
+    assert seen[0][0].startswith("market-search") and seen[0][1:] == ("rain", True, 5, 0)
+    assert seen[1][0].startswith("market-search") and seen[1][1] == 3
+
+
+def test_parse_market_decodes_string_fields():
+    search = MarketSearch()
+
+    first = search._parse_market(GAMMA_MARKET)
+    first["token_id_list"].append("mutated")
+    second = search._parse_market(GAMMA_MARKET)
+
+    assert second["token_ids"] == {"yes": "1", "no": "2"}
+    assert second["token_id_list"] == ["1", "2"]
+    assert second["prices"] == {"yes": 0.4, "no": 0.6}
+    assert search._parse_market({**GAMMA_MARKET, "outcomes": "not json"})["outcomes"] == ["Yes", "No"]
+
+
+def test_parse_market_multi_outcome():
+    search = MarketSearch()
+    market = {
+        **GAMMA_MARKET,
+        "clobTokenIds": '["1", "2", "3"]',
+        "outcomes": '["Red", "Blue", "Green"]',
+        "outcomePrices": '["0.2", "bad"]',
+    }
+
+    parsed = search._parse_market(market)
+
+    assert parsed["outcomes"] == ["Red", "Blue", "Green"]
+    assert parsed["token_ids"] == {"red": "1", "blue": "2", "green": "3"}
+    assert parsed["prices"] == {"red": 0.2, "blue": 0.0}
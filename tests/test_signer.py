@@ -7,13 +7,11 @@ Run with:
     pytest tests/test_signer.py -v
 """
 
-import pytest
-import sys
-from pathlib import Path
+import itertools
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
+import src.signer as signer_module
 from src.signer import OrderSigner, Order, SignerError
 
 
@@ -23,15 +21,16 @@ class TestOrderSigner:
     # Valid test private key (not a real wallet with funds!)
     TEST_PRIVATE_KEY = "0x" + "a" * 64
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.signer = OrderSigner(self.TEST_PRIVATE_KEY)
-        self.test_address = self.signer.address
+    @pytest.fixture(scope="class")
+    @classmethod
+    def signer(cls):
+        """One signer per class; deriving the key's address is not free."""
+        return OrderSigner(cls.TEST_PRIVATE_KEY)
 
-    def test_signer_address_from_key(self):
+    def test_signer_address_from_key(self, signer):
         """Test that signer has correct address from key."""
-        assert self.test_address.startswith("0x")
-        assert len(self.test_address) == 42
+        assert signer.address.startswith("0x")
+        assert len(signer.address) == 42
 
     def test_invalid_key_raises(self):
         """Test that invalid key raises ValueError."""
@@ -44,36 +43,54 @@ class TestOrderSigner:
         # Just verify the method exists and has correct signature
         assert hasattr(OrderSigner, 'from_encrypted')
 
-    def test_sign_auth_message(self):
+    def test_sign_auth_message(self, signer):
         """Test signing authentication message."""
-        signature = self.signer.sign_auth_message()
+        signature = signer.sign_auth_message()
 
         assert signature is not None
         assert signature.startswith("0x")
         assert len(signature) == 132  # 65 bytes * 2 + 0x
 
-    def test_sign_auth_message_with_timestamp(self):
+    def test_sign_auth_message_with_timestamp(self, signer):
         """Test signing with custom timestamp."""
         timestamp = "1234567890"
-        signature = self.signer.sign_auth_message(timestamp=timestamp)
+        signature = signer.sign_auth_message(timestamp=timestamp)
 
         assert signature is not None
         assert signature.startswith("0x")
 
-    def test_sign_auth_message_with_nonce(self):
+    def test_sign_auth_message_with_nonce(self, signer):
         """Test signing with custom nonce."""
-        signature = self.signer.sign_auth_message(nonce=42)
+        signature = signer.sign_auth_message(nonce=42)
 
         assert signature is not None
 
-    def test_sign_order_dict_basic(self):
+    def test_sign_auth_message_matches_typed_data_encoding(self, signer):
+        """Test that precomputed hashing signs the same digest as encode_typed_data."""
+        from eth_account.messages import encode_typed_data
+
+        signable = encode_typed_data(
+            domain_data=OrderSigner.DOMAIN,
+            message_types=OrderSigner.AUTH_TYPES,
+            message_data={
+                "address": signer.address,
+                "timestamp": "1234567890",
+                "nonce": 7,
+                "message": OrderSigner.AUTH_MESSAGE,
+            },
+        )
+        expected = "0x" + signer.wallet.sign_message(signable).signature.hex()
+
+        assert signer.sign_auth_message(timestamp="1234567890", nonce=7) == expected
+
+    def test_sign_order_dict_basic(self, signer):
         """Test signing order with basic parameters."""
-        result = self.signer.sign_order_dict(
+        result = signer.sign_order_dict(
             token_id="1234567890123456789",
             price=0.65,
             size=10.0,
             side="BUY",
-            maker=self.test_address
+            maker=signer.address
         )
 
         assert "order" in result
@@ -85,52 +102,52 @@ class TestOrderSigner:
         assert result["order"]["size"] == 10.0
         assert result["order"]["side"] == "BUY"
 
-    def test_sign_order_dict_sell_side(self):
+    def test_sign_order_dict_sell_side(self, signer):
         """Test signing SELL order."""
-        result = self.signer.sign_order_dict(
+        result = signer.sign_order_dict(
             token_id="1234567890123456789",
             price=0.35,
             size=5.0,
             side="SELL",
-            maker=self.test_address
+            maker=signer.address
         )
 
         assert result["order"]["side"] == "SELL"
 
-    def test_sign_order_with_nonce(self):
+    def test_sign_order_with_nonce(self, signer):
         """Test signing order with custom nonce."""
-        result = self.signer.sign_order_dict(
+        result = signer.sign_order_dict(
             token_id="1234567890123456789",
             price=0.65,
             size=10.0,
             side="BUY",
-            maker=self.test_address,
+            maker=signer.address,
             nonce=12345
         )
 
         assert result["order"]["nonce"] == 12345
 
-    def test_sign_order_with_fee(self):
+    def test_sign_order_with_fee(self, signer):
         """Test signing order with fee rate."""
-        result = self.signer.sign_order_dict(
+        result = signer.sign_order_dict(
             token_id="1234567890123456789",
             price=0.65,
             size=10.0,
             side="BUY",
-            maker=self.test_address,
+            maker=signer.address,
             fee_rate_bps=100  # 1%
         )
 
         assert result["order"]["feeRateBps"] == 100
 
-    def test_sign_order_generates_valid_signature(self):
+    def test_sign_order_generates_valid_signature(self, signer):
         """Test that signature is valid format."""
-        result = self.signer.sign_order_dict(
+        result = signer.sign_order_dict(
             token_id="1234567890123456789",
             price=0.65,
             size=10.0,
             side="BUY",
-            maker=self.test_address
+            maker=signer.address
         )
 
         signature = result["signature"]
@@ -138,19 +155,55 @@ class TestOrderSigner:
         assert signature.startswith("0x")
         assert len(signature) == 132  # 65 bytes hex encoded
 
+    def test_sign_order_matches_typed_data_encoding(self, signer):
+        """Test that precomputed hashing signs the same digest as encode_typed_data."""
+        from eth_account.messages import encode_typed_data
 
-class TestOrder:
-    """Tests for Order dataclass."""
-
-    def test_order_creation(self):
-        """Test creating an Order."""
         order = Order(
             token_id="1234567890123456789",
             price=0.65,
             size=10.0,
-            side="BUY",
-            maker="0x1234567890123456789012345678901234567890"
+            side="SELL",
+            maker=signer.address,
+            nonce=12345,
         )
+        signable = encode_typed_data(
+            domain_data=OrderSigner.DOMAIN,
+            message_types=OrderSigner.ORDER_TYPES,
+            message_data={
+                "salt": 0,
+                "maker": signer.address,
+                "signer": signer.address,
+                "taker": "0x0000000000000000000000000000000000000000",
+                "tokenId": int(order.token_id),
+                "makerAmount": int(order.maker_amount),
+                "takerAmount": int(order.taker_amount),
+                "expiration": 0,
+                "nonce": order.nonce,
+                "feeRateBps": order.fee_rate_bps,
+                "side": order.side_value,
+                "signatureType": order.signature_type,
+            },
+        )
+        expected = "0x" + signer.wallet.sign_message(signable).signature.hex()
+
+        assert signer.sign_order(order)["signature"] == expected
+
+
+class TestOrder:
+    """Tests for Order dataclass."""
+
+    ORDER_KWARGS = {
+        "token_id": "1234567890123456789",
+        "price": 0.65,
+        "size": 10.0,
+        "side": "BUY",
+        "maker": "0x1234567890123456789012345678901234567890",
+    }
+
+    def test_order_creation(self):
+        """Test creating an Order."""
+        order = Order(**self.ORDER_KWARGS)
 
         assert order.token_id == "1234567890123456789"
         assert order.price == 0.65
@@ -159,82 +212,40 @@ class TestOrder:
 
     def test_order_side_normalized_to_upper(self):
         """Test that side is normalized to uppercase."""
-        order = Order(
-            token_id="1234567890123456789",
-            price=0.65,
-            size=10.0,
-            side="buy",  # lowercase
-            maker="0x1234567890123456789012345678901234567890"
-        )
+        order = Order(**{**self.ORDER_KWARGS, "side": "buy"})
 
         assert order.side == "BUY"
 
-    def test_order_invalid_side_raises(self):
-        """Test that invalid side raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid side"):
-            Order(
-                token_id="1234567890123456789",
-                price=0.65,
-                size=10.0,
-                side="INVALID",
-                maker="0x1234567890123456789012345678901234567890"
-            )
-
-    def test_order_invalid_price_too_low(self):
-        """Test that price <= 0 raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid price"):
-            Order(
-                token_id="1234567890123456789",
-                price=0,
-                size=10.0,
-                side="BUY",
-                maker="0x1234567890123456789012345678901234567890"
-            )
-
-    def test_order_invalid_price_above_one(self):
-        """Test that price > 1 raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid price"):
-            Order(
-                token_id="1234567890123456789",
-                price=1.5,
-                size=10.0,
-                side="BUY",
-                maker="0x1234567890123456789012345678901234567890"
-            )
-
-    def test_order_invalid_size_raises(self):
-        """Test that size <= 0 raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid size"):
-            Order(
-                token_id="1234567890123456789",
-                price=0.65,
-                size=0,
-                side="BUY",
-                maker="0x1234567890123456789012345678901234567890"
-            )
+    @pytest.mark.parametrize("field,value,message", [
+        ("side", "INVALID", "Invalid side"),
+        ("price", 0, "Invalid price"),
+        ("price", 1.5, "Invalid price"),
+        ("size", 0, "Invalid size"),
+    ])
+    def test_order_invalid_field_raises(self, field, value, message):
+        """Test that invalid side, price (<= 0 or > 1) and size raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            Order(**{**self.ORDER_KWARGS, field: value})
 
     def test_order_uses_timestamp_as_nonce(self):
         """Test that nonce defaults to timestamp."""
-        order = Order(
-            token_id="1234567890123456789",
-            price=0.65,
-            size=10.0,
-            side="BUY",
-            maker="0x1234567890123456789012345678901234567890"
-        )
+        order = Order(**self.ORDER_KWARGS)
 
         assert order.nonce is not None
         assert isinstance(order.nonce, int)
 
+    def test_order_nonce_source_is_pluggable(self, monkeypatch):
+        """Test that default nonces come from the module-level nonce source."""
+        monkeypatch.setattr(signer_module, "_nonce_source", itertools.count(1).__next__)
+
+        first = Order(**self.ORDER_KWARGS)
+        second = Order(**self.ORDER_KWARGS)
+
+        assert (first.nonce, second.nonce) == (1, 2)
+
     def test_order_calculates_maker_amount(self):
         """Test that maker_amount is calculated correctly."""
-        order = Order(
-            token_id="1234567890123456789",
-            price=0.65,
-            size=10.0,
-            side="BUY",
-            maker="0x1234567890123456789012345678901234567890"
-        )
+        order = Order(**self.ORDER_KWARGS)
 
         # maker_amount = size * price * 1e6
         expected = str(int(10.0 * 0.65 * 1_000_000))
@@ -242,13 +253,7 @@ class TestOrder:
 
     def test_order_calculates_taker_amount(self):
         """Test that taker_amount is calculated correctly."""
-        order = Order(
-            token_id="1234567890123456789",
-            price=0.65,
-            size=10.0,
-            side="BUY",
-            maker="0x1234567890123456789012345678901234567890"
-        )
+        order = Order(**self.ORDER_KWARGS)
 
         # taker_amount = size * 1e6
         expected = str(int(10.0 * 1_000_000))
@@ -256,25 +261,13 @@ class TestOrder:
 
     def test_order_side_value_buy(self):
         """Test that BUY side has correct numeric value."""
-        order = Order(
-            token_id="1234567890123456789",
-            price=0.65,
-            size=10.0,
-            side="BUY",
-            maker="0x1234567890123456789012345678901234567890"
-        )
+        order = Order(**self.ORDER_KWARGS)
 
         assert order.side_value == 0
 
     def test_order_side_value_sell(self):
         """Test that SELL side has correct numeric value."""
-        order = Order(
-            token_id="1234567890123456789",
-            price=0.65,
-            size=10.0,
-            side="SELL",
-            maker="0x1234567890123456789012345678901234567890"
-        )
+        order = Order(**{**self.ORDER_KWARGS, "side": "SELL"})
 
         assert order.side_value == 1
 
@@ -4,10 +4,6 @@ Unit tests for thread-local HTTP sessions.
 
 import queue
 import threading
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.client import ApiClient
 from src.gamma_client import GammaClient
@@ -8,12 +8,7 @@ Run with:
 """
 
 import os
-import sys
 import pytest
-from pathlib import Path
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils import (
     validate_address,
@@ -0,0 +1,58 @@
+"""
+Unit tests for incremental orderbook updates in the WebSocket client.
+"""
+
+import asyncio
+
+from src.websocket_client import MarketWebSocket, OrderbookSnapshot
+
+
+def _snapshot() -> OrderbookSnapshot:
+    return OrderbookSnapshot.from_message({
+        "asset_id": "1",
+        "market": "0xabc",
+        "timestamp": "0",
+        "bids": [{"price": "0.40", "size": "10"}, {"price": "0.42", "size": "5"}],
+        "asks": [{"price": "0.47", "size": "8"}, {"price": "0.45", "size": "3"}],
+    })
+
+
+def test_apply_change_inserts_new_best_levels():
+    book = _snapshot()
+
+    book.apply_change(0.43, 7, "BUY")
+    book.apply_change(0.44, 2, "SELL")
+
+    assert [level.price for level in book.bids] == [0.43, 0.42, 0.40]
+    assert [level.price for level in book.asks] == [0.44, 0.45, 0.47]
+    assert book.best_bid == 0.43
+    assert book.best_ask == 0.44
+
+
+def test_apply_change_updates_and_removes_levels():
+    book = _snapshot()
+
+    book.apply_change(0.40, 12, "BUY")
+    book.apply_change(0.42, 0, "BUY")
+    book.apply_change(0.50, 0, "SELL")  # removing a missing level is a no-op
+
+    assert [(level.price, level.size) for level in book.bids] == [(0.40, 12)]
+    assert [level.price for level in book.asks] == [0.45, 0.47]
+
+
+def test_price_change_message_updates_cached_book():
+    ws = MarketWebSocket()
+    ws._orderbooks["1"] = _snapshot()
+
+    asyncio.run(ws._handle_message({
+        "event_type": "price_change",
+        "market": "0xabc",
+        "price_changes": [
+            {"asset_id": "1", "price": "0.42", "size": "0", "side": "BUY"},
+            {"asset_id": "1", "price": "0.44", "size": "4", "side": "SELL"},
+        ],
+    }))
+
+    book = ws.get_orderbook("1")
+    assert book.best_bid == 0.40
+    assert book.best_ask == 0.44